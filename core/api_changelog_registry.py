@@ -6,13 +6,30 @@ Maintains a database of known API endpoints for software changelogs and release
 
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+
+# Prefetched changelogs, one JSON file per tool:
+# {"tool_name": "Slack", "updates": [{"feature_name": ..., "release_date": ...}]}
+# e.g. exported from the vendor's changelog API by a scheduled job
+DEFAULT_CHANGELOG_DIR = Path("data/api_changelogs")
+
+
+@lru_cache(maxsize=1024)
+def _tool_key(tool_name: str) -> str:
+    """Registry key for a tool name (case/whitespace-insensitive)"""
+    return tool_name.lower().strip()
 
 
 class APIChangelogRegistry:
     """Registry of known API endpoints for software changelogs"""
     
-    def __init__(self):
+    def __init__(self, changelog_dir: Path = DEFAULT_CHANGELOG_DIR):
         self.endpoints = self._initialize_registry()
+        self.load_cached_updates(changelog_dir)
     
     def _initialize_registry(self) -> Dict[str, Dict]:
         """Initialize the registry with known API endpoints"""
@@ -219,9 +236,11 @@ class APIChangelogRegistry:
             tool_name: Name of the tool (case-insensitive)
             
         Returns:
-            Dictionary with endpoint information or None if not found
+            Dictionary with endpoint information or None if not found.
+            Includes 'cached_updates' when changelog data has been
+            prefetched with set_cached_updates()
         """
-        tool_key = tool_name.lower().strip()
+        tool_key = _tool_key(tool_name)
         return self.endpoints.get(tool_key)
     
     def has_api_endpoint(self, tool_name: str) -> bool:
@@ -249,9 +268,41 @@ class APIChangelogRegistry:
             tool_name: Name of the tool
             endpoint_info: Dictionary with endpoint configuration
         """
-        tool_key = tool_name.lower().strip()
+        tool_key = _tool_key(tool_name)
         self.endpoints[tool_key] = endpoint_info
     
+    def set_cached_updates(self, tool_name: str, updates: List[Dict]) -> None:
+        """
+        Attach prefetched changelog updates to a registered tool
+        Researchers return these directly instead of running web research
+        
+        Args:
+            tool_name: Name of a tool already in the registry
+            updates: Updates in the research result format
+        """
+        tool_key = _tool_key(tool_name)
+        if tool_key not in self.endpoints:
+            raise KeyError(f"{tool_name} is not in the API registry")
+        self.endpoints[tool_key]['cached_updates'] = updates
+    
+    def load_cached_updates(self, changelog_dir: Path) -> int:
+        """
+        Attach every prefetched changelog file in changelog_dir
+        Files for tools that aren't registered, or that don't parse, are skipped
+        
+        Returns:
+            Number of tools that got prefetched updates
+        """
+        loaded = 0
+        for changelog_file in sorted(Path(changelog_dir).glob("*.json")):
+            try:
+                changelog = orjson.loads(changelog_file.read_bytes())
+                self.set_cached_updates(changelog['tool_name'], changelog['updates'])
+                loaded += 1
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                print(f"   ⚠️ Skipping changelog {changelog_file.name}: {e}")
+        return loaded
+    
     def get_all_tools(self) -> List[str]:
         """Get list of all tools in the registry"""
         return list(self.endpoints.keys())
@@ -275,11 +326,16 @@ class APIChangelogRegistry:
         }
 
 
+@lru_cache(maxsize=1)
+def get_registry() -> APIChangelogRegistry:
+    """Process-wide registry, built once and shared by every researcher"""
+    return APIChangelogRegistry()
+
+
 # Convenience function for quick access
 def get_api_endpoint(tool_name: str) -> Optional[Dict]:
     """Quick function to get endpoint info for a tool"""
-    registry = APIChangelogRegistry()
-    return registry.get_endpoint(tool_name)
+    return get_registry().get_endpoint(tool_name)
 
 
 # Example usage and testing
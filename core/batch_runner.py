@@ -0,0 +1,177 @@
+"""
+Batch Report Runner - Runs the analysis and report stages for many clients
+through the OpenAI Batch API instead of realtime crew calls
+
+Non-interactive runs (e.g. nightly reports for a portfolio of clients) get
+the Batch API's lower price and separate rate limits. The report depends on
+the analysis, so a run is two batches: every client's analyst prompt, then
+every client's report sections.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
+
+from openai import AsyncOpenAI
+import orjson
+from dotenv import load_dotenv
+
+from core.context_builder import format_tool_inventory
+from core.integration_analyzer import IntegrationAnalyzer, build_analysis_messages
+from core.report_writer import ReportWriter, build_section_messages, finalize_section
+
+load_dotenv()
+
+_TERMINAL_STATUSES = frozenset(("completed", "failed", "expired", "cancelled"))
+
+
+class BatchReportRunner:
+    """
+    Generates audit reports for several clients via the OpenAI Batch API
+    Research (Phase 1) is done beforehand; this covers Phases 2 and 3
+    """
+
+    def __init__(self, poll_interval_seconds: float = 30.0):
+        self.client = AsyncOpenAI()
+        self.model = os.getenv("OPENAI_MODEL", "gpt-5")
+        self.poll_interval = poll_interval_seconds
+        self.analyzer = IntegrationAnalyzer()
+        self.writer = ReportWriter()
+
+    async def run(
+        self,
+        jobs: List[Tuple[List[Dict[str, Any]], str]]
+    ) -> List[str]:
+        """
+        Analyze and write reports for every (enriched_tools, client_name) job
+
+        Args:
+            jobs: List of (enriched_tools, client_name) tuples
+
+        Returns:
+            Report paths, in the same order as jobs
+        """
+        inventories = [format_tool_inventory(tools) for tools, _ in jobs]
+
+        # Round 1: integration analysis for every client
+        print(f"\n📦 Submitting analysis batch for {len(jobs)} client(s)")
+        analysis_requests = [
+            self._request(
+                f"{i}:analysis",
+                build_analysis_messages(
+                    client_name,
+                    self.analyzer._prepare_context(tools, client_name, inventory)
+                ),
+                json_mode=True
+            )
+            for i, ((tools, client_name), inventory) in enumerate(zip(jobs, inventories))
+        ]
+        analysis_output = await self._run_batch(analysis_requests)
+
+        all_opportunities = [
+            self.analyzer._parse_opportunities(
+                analysis_output.get(f"{i}:analysis", ""),
+                tools
+            )
+            for i, (tools, _) in enumerate(jobs)
+        ]
+
+        # Round 2: every report section for every client
+        now = datetime.now()
+        section_titles = []
+        section_requests = []
+        for i, ((tools, client_name), inventory, opportunities) in enumerate(
+            zip(jobs, inventories, all_opportunities)
+        ):
+            context = self.writer._prepare_report_context(
+                tools, opportunities, client_name, inventory, now=now
+            )
+            titles = []
+            for n, (title, messages) in enumerate(build_section_messages(client_name, context)):
+                titles.append(title)
+                section_requests.append(self._request(f"{i}:section:{n}", messages))
+            section_titles.append(titles)
+
+        print(f"\n📦 Submitting report batch ({len(section_requests)} sections)")
+        section_output = await self._run_batch(section_requests)
+
+        # Stitch and save each client's report
+        loop = asyncio.get_running_loop()
+        report_paths = []
+        for i, (_, client_name) in enumerate(jobs):
+            sections = []
+            for n, title in enumerate(section_titles[i]):
+                text = section_output.get(f"{i}:section:{n}")
+                if text is None:
+                    text = "_This section could not be generated in batch mode._"
+                fut = loop.create_future()
+                fut.set_result(finalize_section(title, text))
+                sections.append(fut)
+            report_path = await self.writer._save_report(sections, client_name, now=now)
+            report_paths.append(str(report_path))
+
+        return report_paths
+
+    def _request(
+        self,
+        custom_id: str,
+        messages: List[Dict[str, str]],
+        json_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Build one Batch API request line"""
+        body = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": 1  # GPT-5 only supports temperature=1
+        }
+        if json_mode:
+            body["response_format"] = {"type": "json_object"}
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": body
+        }
+
+    async def _run_batch(self, requests: List[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Submit a batch, wait for it to finish and collect the outputs
+
+        Returns:
+            Map of custom_id to message content for successful requests
+        """
+        payload = b"\n".join(orjson.dumps(r) for r in requests)
+        input_file = await self.client.files.create(
+            file=("tsat_batch.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        print(f"   ⏳ Batch {batch.id} submitted ({len(requests)} requests)")
+
+        while batch.status not in _TERMINAL_STATUSES:
+            await asyncio.sleep(self.poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+
+        print(f"   ✅ Batch {batch.id} finished: {batch.status}")
+        if not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} produced no output (status: {batch.status})")
+
+        content = await self.client.files.content(batch.output_file_id)
+
+        results = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                print(f"   ⚠️ Batch request {record.get('custom_id')} failed: {record.get('error')}")
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+
+        return results
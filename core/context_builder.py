@@ -0,0 +1,203 @@
+"""
+Context Builder - Shared tool-inventory formatting for the LLM prompts
+Both the integration analyzer and the report writer embed the same inventory
+text, so it is built once per audit and handed to each stage
+"""
+
+from typing import List, Dict, Any, Iterator, Optional
+from functools import lru_cache
+from itertools import chain, islice
+import os
+
+import orjson
+import tiktoken
+
+from core.log_config import logger
+
+
+HEAVY_DIVIDER = "=" * 60
+LIGHT_DIVIDER = "-" * 60
+
+_AUTOMATION_HITS = frozenset(("high", "medium"))
+_MAX_UPDATES_PER_TOOL = 5
+
+# Prompt budget for the tool inventory. Large stacks are trimmed to fit,
+# starting with the least critical tools, instead of overflowing the
+# model's context window.
+CONTEXT_TOKEN_BUDGET = int(os.getenv("TSAT_CONTEXT_TOKEN_BUDGET", "60000"))
+
+# Detail levels for a tool block, most to least verbose
+_FULL_DETAIL = 2
+_NO_UPDATES_DETAIL = 1   # drop the per-update research findings
+_SUMMARY_DETAIL = 0      # also drop the users list
+
+_CRITICALITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+
+
+@lru_cache(maxsize=None)
+def _encoding() -> Optional[tiktoken.Encoding]:
+    """Tokenizer for the configured model (loaded once, on first use)"""
+    try:
+        try:
+            return tiktoken.encoding_for_model(os.getenv("OPENAI_MODEL", "gpt-5"))
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        # The BPE files are downloaded on first use; offline, estimate instead
+        logger.warning("Tokenizer unavailable (%s); estimating token counts", e)
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Number of prompt tokens text encodes to for the configured model"""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // 4 + 1  # ~4 characters per token for English text
+    return len(encoding.encode(text))
+
+
+def _iter_tool_lines(tool: Dict[str, Any], detail: int = _FULL_DETAIL) -> Iterator[str]:
+    """Yield the inventory lines describing a single tool"""
+    yield f"""{tool['name']}
+  Category: {tool['category']}
+  Type: {tool['type']}"""
+    if detail > _SUMMARY_DETAIL:
+        yield f"  Used by: {', '.join(tool['users'])}"
+    yield f"  Criticality: {tool['criticality']}"
+
+    # Add research findings
+    research = tool.get('research_result', {})
+    if research.get('success'):
+        updates = tool.get('analyzed_updates', [])
+        yield f"  Updates found: {len(updates)}"
+
+        # Recent updates, automation-relevant ones first
+        ranked = chain(
+            (u for u in updates
+             if u.get('automation_potential', 'low') in _AUTOMATION_HITS),
+            (u for u in updates
+             if u.get('automation_potential', 'low') not in _AUTOMATION_HITS),
+        )
+        top_updates = list(islice(ranked, _MAX_UPDATES_PER_TOOL))
+        if top_updates and detail >= _FULL_DETAIL:
+            yield "  Recent updates:"
+            for update in top_updates:
+                yield (
+                    f"    - {update.get('feature_name', 'Unknown')} "
+                    f"[{update.get('update_category', 'N/A')}; "
+                    f"automation potential: {update.get('automation_potential', 'Unknown')}]"
+                )
+                if update.get('automation_value'):
+                    yield f"      Value: {update['automation_value']}"
+                if update.get('business_impact'):
+                    yield f"      Impact: {update['business_impact']}"
+
+        # Add API info
+        if research.get('has_api'):
+            yield f"  ✅ API Available: {research.get('api_type', 'REST')}"
+        else:
+            yield "  ⚠️  API status unknown"
+    else:
+        yield f"  Research incomplete: {research.get('error', 'Unknown')}"
+
+    yield LIGHT_DIVIDER
+
+
+@lru_cache(maxsize=256)
+def _format_tool_block(tool_json: bytes, detail: int = _FULL_DETAIL) -> str:
+    """
+    Render one tool's inventory block from its canonical JSON form
+
+    Memoized so retries and repeated runs over the same inventory reuse
+    the already-formatted text instead of walking every tool again.
+    """
+    return "\n".join(_iter_tool_lines(orjson.loads(tool_json), detail))
+
+
+def format_tool_inventory(
+    enriched_tools: List[Dict[str, Any]],
+    token_budget: Optional[int] = None
+) -> str:
+    """
+    Format the researched tool stack for inclusion in an LLM prompt
+
+    Args:
+        enriched_tools: List of tools with research data
+        token_budget: Max tokens for the inventory (defaults to
+            CONTEXT_TOKEN_BUDGET)
+
+    Returns:
+        Inventory section text, one block per tool. Over budget, the least
+        critical tools lose detail first and are then left out, so the text
+        fits unless the header alone does not
+    """
+    if token_budget is None:
+        token_budget = CONTEXT_TOKEN_BUDGET
+
+    header = "\n".join(["TOOL INVENTORY WITH RECENT UPDATES:", HEAVY_DIVIDER, ""])
+    keys = [
+        orjson.dumps(tool, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        for tool in enriched_tools
+    ]
+    blocks = [_format_tool_block(key) for key in keys]
+    inventory = "\n".join([header, *blocks])
+
+    total = count_tokens(inventory)
+    if total <= token_budget:
+        return inventory
+
+    # Over budget: trim least critical tools first, research findings before
+    # the users list, re-counting only the block that changed
+    order = sorted(
+        range(len(enriched_tools)),
+        key=lambda i: _CRITICALITY_RANK.get(
+            str(enriched_tools[i].get('criticality', '')).strip().lower(), 2
+        ),
+        reverse=True
+    )
+    trimmed = set()
+    for detail in (_NO_UPDATES_DETAIL, _SUMMARY_DETAIL):
+        for i in order:
+            if total <= token_budget:
+                break
+            smaller = _format_tool_block(keys[i], detail)
+            total -= count_tokens(blocks[i]) - count_tokens(smaller)
+            blocks[i] = smaller
+            trimmed.add(i)
+
+    # Still over with every tool at summary detail: leave out the least
+    # critical tools altogether, noting how many were dropped. Block counts
+    # ignore the joins, so the final text is checked exactly
+    kept = [True] * len(blocks)
+    omitted = 0
+    for i in order:
+        if total <= token_budget:
+            inventory = _join_inventory(header, blocks, kept, omitted)
+            if count_tokens(inventory) <= token_budget:
+                break
+        if not omitted:
+            total += count_tokens(_omitted_note(len(blocks)))
+        total -= count_tokens(blocks[i])
+        kept[i] = False
+        omitted += 1
+    else:
+        inventory = _join_inventory(header, blocks, kept, omitted)
+
+    logger.warning(
+        "Tool inventory over %d-token budget; trimmed detail for %d and omitted %d of %d tools",
+        token_budget, len(trimmed), omitted, len(enriched_tools)
+    )
+    return inventory
+
+
+def _join_inventory(header: str, blocks: List[str], kept: List[bool], omitted: int) -> str:
+    """Inventory text from the kept blocks, plus a note on any omitted tools"""
+    lines = [header, *(block for block, keep in zip(blocks, kept) if keep)]
+    if omitted:
+        lines.append(_omitted_note(omitted))
+    return "\n".join(lines)
+
+
+def _omitted_note(omitted: int) -> str:
+    """Closing line standing in for the tools left out of the inventory"""
+    return f"... {omitted} more tools omitted (lowest criticality) to fit the prompt budget"
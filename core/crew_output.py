@@ -0,0 +1,58 @@
+"""
+Crew Output - Reads the JSON answer out of a crew.kickoff() result
+With output_json set on the final task, crewai hands back the already
+validated object; older releases return it as a plain dict, newer ones
+on the CrewOutput (json_dict / pydantic) next to the unvalidated text
+"""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+
+# A whole answer wrapped in a Markdown code fence (```json ... ```)
+_CODE_FENCE_RE = re.compile(r'^\s*```[\w-]*[ \t]*\n?(.*?)\n?```\s*$', re.DOTALL)
+
+
+def crew_output_text(crew_result: Any) -> str:
+    """The final answer's raw text"""
+    if isinstance(crew_result, dict):
+        return orjson.dumps(crew_result).decode()
+    raw = getattr(crew_result, 'raw', None)
+    return raw if isinstance(raw, str) else str(crew_result)
+
+
+def strip_code_fence(text: str) -> str:
+    """text without the Markdown code fence the model wrapped it in, if any"""
+    match = _CODE_FENCE_RE.match(text)
+    return match.group(1) if match else text
+
+
+def crew_output_json(crew_result: Any) -> Tuple[Optional[Dict[str, Any]], str]:
+    """
+    The final answer as a JSON object, plus its raw text
+
+    Uses the object crewai validated against output_json when there is one,
+    and only otherwise parses the raw text (code fence stripped).
+
+    Returns:
+        (parsed object or None if the text isn't a JSON object, raw text)
+    """
+    if isinstance(crew_result, dict):
+        return crew_result, crew_output_text(crew_result)
+
+    json_dict = getattr(crew_result, 'json_dict', None)
+    if isinstance(json_dict, dict):
+        return json_dict, crew_output_text(crew_result)
+
+    model = getattr(crew_result, 'pydantic', None)
+    if model is not None and hasattr(model, 'model_dump'):
+        return model.model_dump(), crew_output_text(crew_result)
+
+    text = crew_output_text(crew_result)
+    try:
+        parsed = orjson.loads(strip_code_fence(text))
+    except orjson.JSONDecodeError:
+        return None, text
+    return (parsed if isinstance(parsed, dict) else None), text
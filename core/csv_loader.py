@@ -25,6 +25,13 @@ def load_input(file_path: str) -> pd.DataFrame:
     except Exception as e:
         raise ValueError(f"Failed to read CSV file: {e}")
     
+    return prepare_input(df)
+
+def prepare_input(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Validate and clean an already-loaded tech stack DataFrame.
+    Same checks load_input applies after reading the file.
+    """
     # Validate required columns
     missing = REQUIRED_COLUMNS - set(df.columns)
     if missing:
@@ -68,6 +75,35 @@ def convert_df_to_tool_inventory(df: pd.DataFrame) -> Dict[str, dict]:
     
     return tool_inventory
 
+def convert_df_to_tool_records(df: pd.DataFrame) -> List[dict]:
+    """
+    Convert DataFrame to a list of tool records (name, category, users,
+    criticality), one per tool, in CSV order.
+    Same cleaning rules as convert_df_to_tool_inventory, done column-wise.
+    """
+    names = df['Tool Name'].fillna('').astype(str).str.strip()
+    keep = (names != '') & (names.str.lower() != 'nan')
+    
+    # Handle users field - can be comma-separated
+    users = (
+        df['Used By'].fillna('').astype(str)
+        .mask(lambda col: col.str.lower() == 'nan', '')
+        .str.split(',')
+        .map(lambda parts: [u.strip() for u in parts if u.strip()] or ['Unknown'])
+    )
+    
+    records = pd.DataFrame({
+        'name': names,
+        'category': df['Category'].fillna('nan').astype(str).str.strip(),
+        'users': users,
+        'criticality': df['Criticality'].fillna('nan').astype(str).str.strip()
+    })[keep]
+    
+    # Names that only collide after stripping: the last row wins, as in the dict version
+    records = records.drop_duplicates(subset='name', keep='last')
+    
+    return records.to_dict('records')
+
 def validate_and_load_csv(file_path: str) -> Tuple[Dict[str, dict], List[str]]:
     """
     Complete CSV processing: load, validate, and convert to tool inventory.
@@ -3,12 +3,24 @@
 Feature Analyzer - Analyzes discovered updates for automation potential and business impact
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
 from datetime import datetime
 import json
 from pathlib import Path
 
 
+# Keyword weights for the automation score
+_HIGH_KEYWORD_WEIGHT = 15
+_MEDIUM_KEYWORD_WEIGHT = 5
+_PRIORITY_AREA_WEIGHT = 10
+
+# Indicator groups for the time-savings estimate: (words, points if any match)
+_TIME_SAVINGS_INDICATORS = (
+    (('automate', 'eliminate', 'automated'), 30),
+    (('manual', 'repetitive', 'daily'), 20),
+    (('integration', 'api', 'sync'), 15),
+)
+
 class FeatureAnalyzer:
     """
     Analyzes discovered software updates and categorizes them by:
@@ -40,6 +52,9 @@ class FeatureAnalyzer:
             'communication': ['scheduling', 'recording', 'integration'],
             'operations': ['document processing', 'approval workflows', 'notifications']
         }
+        
+        # (keyword, weight) tables per tool type, built on first use
+        self._scoring_tables: Dict[str, Tuple[Tuple[str, int], ...]] = {}
     
     def analyze_update(self, update: Dict, tool_type: str) -> Dict[str, Any]:
         """
@@ -50,7 +65,7 @@ class FeatureAnalyzer:
             tool_type: Type of tool (e.g., 'crm', 'portfolio_management')
             
         Returns:
-            Enhanced update dictionary with analysis
+            Copy of the update dictionary with an 'analysis' entry added
         """
         feature_name = update.get('feature_name', '')
         description = update.get('description', '')
@@ -72,57 +87,53 @@ class FeatureAnalyzer:
             update.get('implementation_difficulty', 'medium')
         )
         
-        # Add analysis to update
-        update['analysis'] = {
+        # Return a copy with the analysis added; the update itself may be
+        # shared (e.g. a cached research result) and is left untouched
+        return {**update, 'analysis': {
             'automation_potential': self._score_to_level(automation_score),
             'automation_score': automation_score,
             'estimated_time_savings': time_savings,
             'priority': priority,
             'tool_type_relevance': self._check_tool_type_relevance(full_text, tool_type),
             'analyzed_at': datetime.now().isoformat()
-        }
-        
-        return update
+        }}
+    
+    def _scoring_table(self, tool_type: str) -> Tuple[Tuple[str, int], ...]:
+        """All (keyword, weight) pairs that count towards a tool type's score"""
+        table = self._scoring_tables.get(tool_type)
+        if table is None:
+            table = (
+                tuple((kw, _HIGH_KEYWORD_WEIGHT) for kw in self.automation_keywords['high'])
+                + tuple((kw, _MEDIUM_KEYWORD_WEIGHT) for kw in self.automation_keywords['medium'])
+                + tuple(
+                    (area, _PRIORITY_AREA_WEIGHT)
+                    for area in self.tool_type_priorities.get(tool_type, [])
+                )
+            )
+            self._scoring_tables[tool_type] = table
+        return table
     
     def _calculate_automation_score(self, text: str, tool_type: str) -> int:
         """Calculate automation potential score (0-100)"""
-        score = 0
-        
-        # Check for high-value automation keywords
-        for keyword in self.automation_keywords['high']:
-            if keyword in text:
-                score += 15
-        
-        # Check for medium-value keywords
-        for keyword in self.automation_keywords['medium']:
-            if keyword in text:
-                score += 5
-        
-        # Boost score based on tool type priorities
-        priorities = self.tool_type_priorities.get(tool_type, [])
-        for priority_area in priorities:
-            if priority_area in text:
-                score += 10
+        # High/medium keywords plus the tool type's priority areas, one pass
+        score = sum(
+            weight for keyword, weight in self._scoring_table(tool_type)
+            if keyword in text
+        )
         
         # Cap at 100
         return min(score, 100)
     
     def _estimate_time_savings(self, text: str, tool_type: str) -> str:
         """Estimate potential time savings"""
-        score = 0
-        
         # High-impact indicators
-        if any(word in text for word in ['automate', 'eliminate', 'automated']):
-            score += 30
-        
-        if any(word in text for word in ['manual', 'repetitive', 'daily']):
-            score += 20
-        
-        if any(word in text for word in ['integration', 'api', 'sync']):
-            score += 15
+        score = sum(
+            points for words, points in _TIME_SAVINGS_INDICATORS
+            if any(word in text for word in words)
+        )
         
         # Tool-type specific estimates
-        if tool_type in ['crm', 'portfolio_management']:
+        if tool_type in ('crm', 'portfolio_management'):
             score += 10
         
         # Return estimate range
@@ -3,31 +3,194 @@ Integration Analyzer - CrewAI agent for identifying automation opportunities
 Analyzes the complete tool stack to find cross-tool integration opportunities
 """
 
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Dict, Any, Optional
 from crewai import Agent, Task, Crew
-from langchain_openai import ChatOpenAI
-import os
+import orjson
+from pydantic import BaseModel, Field
 from dotenv import load_dotenv
 
+from core.context_builder import format_tool_inventory
+from core.crew_output import crew_output_json
+from core.llm_client import get_llm
+from core.log_config import VERBOSE, log_step, logger
+
 load_dotenv()
 
 
+# Static prompt scaffolding. Everything here must stay free of per-client or
+# per-run values (names, dates) so the prompt prefix hashes identically across
+# calls and the provider's prompt cache can serve it.
+_ANALYST_ROLE = "Integration Automation Specialist"
+
+_ANALYST_GOAL = (
+    "Identify high-value automation opportunities in the client's tech stack "
+    "using open-source tools like n8n"
+)
+
+_ANALYST_BACKSTORY = """You are an expert at identifying workflow automation opportunities.
+            You understand APIs, data flows, and integration patterns. You specialize in 
+            n8n workflow automation and always recommend open-source solutions over proprietary 
+            SaaS platforms. You focus on practical, implementable solutions that save time and 
+            reduce manual work."""
+
+_ANALYSIS_INSTRUCTIONS = """Analyze the client's complete technology stack (provided in CONTEXT at the end) and identify automation opportunities.
+
+YOUR TASK:
+1. Identify cross-tool integration opportunities where data flows between systems
+2. Find manual processes that could be automated with n8n workflows
+3. Prioritize opportunities by ROI (time saved, error reduction, process improvement)
+4. For each opportunity, specify:
+   - Clear opportunity name
+   - Tools involved
+   - Current manual process
+   - Proposed n8n workflow (be specific about nodes/triggers)
+   - Estimated time savings (hours per week/month)
+   - Implementation complexity (Low/Medium/High)
+   - Prerequisites (API access, authentication, etc.)
+
+REQUIREMENTS:
+- Focus ONLY on open-source solutions (n8n, not Zapier/Make)
+- Prioritize opportunities with APIs available
+- Consider the tool updates discovered in research
+- Be specific about n8n node types (HTTP Request, Webhook, Schedule Trigger, etc.)
+- Provide realistic time savings estimates
+
+n8n NODE REFERENCE (name the nodes you would actually use):
+- Schedule Trigger: run a workflow on a timetable (nightly syncs, weekly digests)
+- Webhook: start a workflow when another system pushes an event
+- HTTP Request: call any REST API, including tools without a dedicated n8n node
+- Dedicated app nodes (e.g. Microsoft Outlook, Google Sheets, Slack, Salesforce) where n8n ships one
+- IF / Switch: branch on field values (status changes, thresholds, missing data)
+- Set / Edit Fields: map and rename fields between two systems' data models
+- Merge: join records from two sources on a shared key (email, account number)
+- Split In Batches (Loop Over Items): page through large result sets under API rate limits
+- Code: small JavaScript transforms that the built-in nodes cannot express
+- Error Trigger: route failures to an alert channel so broken syncs are noticed
+- Wait: pause for approvals or for a downstream system to finish processing
+
+COMMON INTEGRATION PATTERNS IN ADVISORY FIRMS (check which apply to this stack):
+- CRM <-> custodian: pull new accounts, balances and transfers into the CRM instead of re-keying them
+- CRM <-> financial planning: push household and account data into planning software, pull plan status back
+- Portfolio management <-> reporting: assemble quarterly client reports and distribute them automatically
+- Email / calendar <-> CRM: log client emails and meetings against the contact record
+- E-signature <-> CRM / document management: file signed forms and advance the workflow when a document completes
+- Compliance: archive communications and flag trades or notes that need review
+- Operations: turn recurring checklists (account openings, RMDs, billing) into scheduled, tracked workflows
+
+PREREQUISITES:
+- List what must be in place before the workflow can be built: API access tier or add-on,
+  admin rights to create API keys or OAuth apps, webhook support, and any vendor approval
+- Call out tools whose API needs a paid plan or vendor partnership; that affects priority
+
+ESTIMATING TIME SAVINGS:
+- Start from the manual task: how often it happens, how long each occurrence takes,
+  and how many people do it. time_savings_hours is hours saved per week across the firm.
+- Be conservative: assume automation removes 60-80% of the manual effort, not all of it.
+- Do not count the same saved hours in two opportunities.
+
+COMPLEXITY:
+- Low: both tools have documented APIs or n8n nodes; one trigger and a few steps; no custom auth
+- Medium: field mapping between different data models, pagination, or OAuth setup
+- High: a tool without an API (file exports, email parsing, browser automation), or
+  multi-step logic with approvals and error recovery
+
+PRIORITY:
+- High: large weekly savings or error reduction, achievable at Low or Medium complexity
+- Medium: solid savings but High complexity, or modest savings at Low complexity
+- Low: nice-to-have, or blocked on prerequisites the client may not be able to meet
+
+Output format: Return a JSON object with an "opportunities" array holding at least 3-5
+opportunities, ranked by priority (highest first). Each opportunity has: name, tools,
+current_process, n8n_workflow, time_savings_hours, complexity, prerequisites, priority.
+
+Example of one opportunity (illustrative only - base yours on the CONTEXT):
+{
+  "name": "New client onboarding sync",
+  "tools": ["CRM", "Document management"],
+  "current_process": "Operations staff re-key new client details from the CRM into the document system and create folders by hand",
+  "n8n_workflow": "Webhook (CRM new-contact event) -> Set (map contact fields) -> HTTP Request (create client folder) -> IF (folder created?) -> Slack (notify operations)",
+  "time_savings_hours": 3,
+  "complexity": "Low",
+  "prerequisites": ["CRM API key with webhook access", "Document system API credentials"],
+  "priority": "High"
+}
+"""
+
+
+def _analysis_description(client_name: str, context: str) -> str:
+    """
+    Analysis task prompt: static instructions first, per-client values last
+
+    The instructions plus the system message come to more than the 1024
+    tokens OpenAI needs before it caches a prompt prefix.
+    """
+    return (
+        f"{_ANALYSIS_INSTRUCTIONS}\n"
+        f"CONTEXT:\n{context}\n\n"
+        f"CLIENT: {client_name}\n"
+    )
+
+
+def build_analysis_messages(client_name: str, context: str) -> List[Dict[str, str]]:
+    """
+    Render the analyst prompt as plain chat messages
+
+    Mirrors what the CrewAI agent sends, for callers that talk to the
+    OpenAI API directly (e.g. the Batch API runner).
+    """
+    return [
+        {
+            "role": "system",
+            "content": f"You are {_ANALYST_ROLE}. {_ANALYST_BACKSTORY}\nYour personal goal is: {_ANALYST_GOAL}"
+        },
+        {"role": "user", "content": _analysis_description(client_name, context)},
+    ]
+
+
+# Treated as "cached long ago" when an entry has no timestamp
+_EPOCH_SENTINEL = datetime(2000, 1, 1)
+
+
+class Opportunity(BaseModel):
+    """A single cross-tool automation opportunity"""
+    name: str = Field(description="Clear opportunity name")
+    tools: List[str] = Field(description="Tools involved")
+    current_process: str = Field(description="Current manual process")
+    n8n_workflow: str = Field(description="Proposed n8n workflow, naming specific nodes/triggers")
+    time_savings_hours: float = Field(description="Estimated hours saved per week")
+    complexity: str = Field(description="Implementation complexity: Low, Medium or High")
+    prerequisites: List[str] = Field(default_factory=list, description="API access, authentication, etc.")
+    priority: str = Field(description="Priority ranking: High, Medium or Low")
+
+
+class OpportunityAnalysis(BaseModel):
+    """Structured analyst output, ranked by priority"""
+    opportunities: List[Opportunity]
+
+
 class IntegrationAnalyzer:
     """
     CrewAI-powered integration analyzer
     Identifies automation opportunities across the complete tool stack
     """
 
-    def __init__(self):
-        self.llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-5"),
-            temperature=1  # GPT-5 only supports temperature=1
-        )
+    def __init__(self, plan_cache_days: int = 30):
+        # Shared, connection-pooled client (GPT-5 only supports temperature=1)
+        self.llm = get_llm(temperature=1)
+        # Opportunities keyed by tool-stack fingerprint, so clients with the
+        # same stack reuse one analysis instead of re-running the analyst
+        self.plan_cache_dir = Path("data/plan_cache")
+        self.plan_cache_duration = timedelta(days=plan_cache_days)
 
     async def analyze_stack(
         self,
         enriched_tools: List[Dict[str, Any]],
-        client_name: str
+        client_name: str,
+        prebuilt_context: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Analyze complete tool stack for integration opportunities
@@ -35,127 +198,117 @@ class IntegrationAnalyzer:
         Args:
             enriched_tools: List of tools with research data
             client_name: Name of client
+            prebuilt_context: Tool inventory from format_tool_inventory(),
+                shared with the report writer (built here if omitted)
 
         Returns:
             List of integration opportunities with n8n workflow specs
         """
 
-        # Create the integration analyst agent
+        # Identical stacks get identical analyses; skip the LLM on a hit
+        fingerprint = self._stack_fingerprint(enriched_tools)
+        cached = self._load_plan_cache(fingerprint)
+        if cached is not None:
+            return cached
+
+        # Create the integration analyst agent. Role, goal and backstory are
+        # kept client-agnostic so the system prompt is byte-identical across
+        # runs and eligible for provider-side prompt caching.
         analyst = Agent(
-            role="Integration Automation Specialist",
-            goal=f"Identify high-value automation opportunities in {client_name}'s tech stack using open-source tools like n8n",
-            backstory="""You are an expert at identifying workflow automation opportunities.
-            You understand APIs, data flows, and integration patterns. You specialize in 
-            n8n workflow automation and always recommend open-source solutions over proprietary 
-            SaaS platforms. You focus on practical, implementable solutions that save time and 
-            reduce manual work.""",
+            role=_ANALYST_ROLE,
+            goal=_ANALYST_GOAL,
+            backstory=_ANALYST_BACKSTORY,
             llm=self.llm,
-            verbose=True
+            verbose=VERBOSE,
+            step_callback=log_step
         )
 
         # Prepare context for the agent
-        context = self._prepare_context(enriched_tools, client_name)
+        context = self._prepare_context(enriched_tools, client_name, prebuilt_context)
 
         # Create analysis task
         analysis_task = Task(
-            description=f"""Analyze {client_name}'s complete technology stack and identify automation opportunities.
-
-CONTEXT:
-{context}
-
-YOUR TASK:
-1. Identify cross-tool integration opportunities where data flows between systems
-2. Find manual processes that could be automated with n8n workflows
-3. Prioritize opportunities by ROI (time saved, error reduction, process improvement)
-4. For each opportunity, specify:
-   - Clear opportunity name
-   - Tools involved
-   - Current manual process
-   - Proposed n8n workflow (be specific about nodes/triggers)
-   - Estimated time savings (hours per week/month)
-   - Implementation complexity (Low/Medium/High)
-   - Prerequisites (API access, authentication, etc.)
-
-REQUIREMENTS:
-- Focus ONLY on open-source solutions (n8n, not Zapier/Make)
-- Prioritize opportunities with APIs available
-- Consider the tool updates discovered in research
-- Be specific about n8n node types (HTTP Request, Webhook, Schedule Trigger, etc.)
-- Provide realistic time savings estimates
-
-Output format: Return a detailed analysis with at least 3-5 opportunities, ranked by priority.
-""",
+            description=_analysis_description(client_name, context),
             agent=analyst,
-            expected_output="A structured list of automation opportunities with n8n implementation details"
+            expected_output="A JSON object listing automation opportunities with n8n implementation details",
+            output_json=OpportunityAnalysis
         )
 
         # Run the analysis
         crew = Crew(
             agents=[analyst],
             tasks=[analysis_task],
-            verbose=True
+            verbose=VERBOSE
         )
 
-        result = crew.kickoff()
+        # crew.kickoff() is blocking; run it in a worker thread so the event
+        # loop stays free for other coroutines while the LLM call is in flight
+        result = await asyncio.to_thread(crew.kickoff)
 
         # Parse the result into structured opportunities
         opportunities = self._parse_opportunities(result, enriched_tools)
 
+        # Only structured results are reusable; a raw_analysis fallback is not
+        if opportunities and 'raw_analysis' not in opportunities[0]:
+            self._save_plan_cache(fingerprint, opportunities)
+
         return opportunities
 
+    @staticmethod
+    def _stack_fingerprint(enriched_tools: List[Dict[str, Any]]) -> str:
+        """Order-independent hash of the stack's tool names and categories"""
+        key = "|".join(sorted(f"{t['name']}:{t['category']}" for t in enriched_tools))
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _load_plan_cache(self, fingerprint: str) -> Optional[List[Dict[str, Any]]]:
+        """Load cached opportunities for a stack if available and not expired"""
+        cache_file = self.plan_cache_dir / f"{fingerprint}.json"
+
+        if not cache_file.exists():
+            return None
+
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+
+            cached_at = cached.get('cached_at')
+            cached_time = datetime.fromisoformat(cached_at) if cached_at else _EPOCH_SENTINEL
+            if datetime.now() - cached_time < self.plan_cache_duration:
+                logger.info("📦 Reusing analysis for identical stack from %s", cached_time.strftime('%Y-%m-%d'))
+                return cached.get('opportunities')
+        except Exception as e:
+            logger.warning("Plan cache read error: %s", e)
+
+        return None
+
+    def _save_plan_cache(self, fingerprint: str, opportunities: List[Dict[str, Any]]):
+        """Save analyzed opportunities for a stack"""
+        try:
+            self.plan_cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_data = {
+                'cached_at': datetime.now().isoformat(),
+                'opportunities': opportunities
+            }
+            (self.plan_cache_dir / f"{fingerprint}.json").write_bytes(
+                orjson.dumps(cache_data, option=orjson.OPT_INDENT_2)
+            )
+        except Exception as e:
+            logger.warning("Plan cache write error: %s", e)
+
     def _prepare_context(
         self,
         enriched_tools: List[Dict[str, Any]],
-        client_name: str
+        client_name: str,
+        inventory: Optional[str] = None
     ) -> str:
         """Prepare formatted context for the agent"""
+        if inventory is None:
+            inventory = format_tool_inventory(enriched_tools)
 
-        context_parts = [f"Client: {client_name}\n"]
-        context_parts.append(f"Total tools in stack: {len(enriched_tools)}\n")
-        context_parts.append("\nTOOL INVENTORY WITH RECENT UPDATES:\n")
-        context_parts.append("=" * 60 + "\n")
-
-        for tool in enriched_tools:
-            context_parts.append(f"\n{tool['name']}")
-            context_parts.append(f"\n  Category: {tool['category']}")
-            context_parts.append(f"\n  Type: {tool['type']}")
-            context_parts.append(f"\n  Used by: {', '.join(tool['users'])}")
-            context_parts.append(f"\n  Criticality: {tool['criticality']}")
-
-            # Add research findings
-            research = tool.get('research_result', {})
-            if research.get('success'):
-                context_parts.append(
-                    f"\n  Updates found: {len(tool.get('analyzed_updates', []))}")
-
-                # Add key automation features
-                updates = tool.get('analyzed_updates', [])
-                automation_updates = [
-                    u for u in updates
-                    if u.get('automation_potential', 'low') in ['high', 'medium']
-                ]
-
-                if automation_updates:
-                    context_parts.append(f"\n  Key automation features:")
-                    for update in automation_updates[:3]:  # Top 3
-                        context_parts.append(
-                            f"\n    - {update.get('feature_name', 'Unknown')}")
-                        context_parts.append(
-                            f"\n      Value: {update.get('automation_value', 'N/A')}")
-
-                # Add API info
-                if research.get('has_api'):
-                    context_parts.append(
-                        f"\n  ✅ API Available: {research.get('api_type', 'REST')}")
-                else:
-                    context_parts.append(f"\n  ⚠️  API status unknown")
-            else:
-                context_parts.append(
-                    f"\n  Research incomplete: {research.get('error', 'Unknown')}")
-
-            context_parts.append("\n" + "-" * 60)
-
-        return "".join(context_parts)
+        return (
+            f"Client: {client_name}\n"
+            f"Total tools in stack: {len(enriched_tools)}\n\n"
+            f"{inventory}"
+        )
 
     def _parse_opportunities(
         self,
@@ -163,28 +316,30 @@ Output format: Return a detailed analysis with at least 3-5 opportunities, ranke
         enriched_tools: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """
-        Parse CrewAI result into structured opportunities
+        Parse the analyst's JSON output into structured opportunities
 
-        Note: This is a simple parser. In production, you might want
-        to ask the agent to output JSON for easier parsing.
+        crew_result is a crew.kickoff() result or, from the Batch API runner,
+        the model's message text. Falls back to a single raw_analysis entry if the output does not
+        validate, so the report writer can still work from the text.
         """
-
-        # For now, extract the raw text output
-        result_text = str(crew_result)
-
-        # Create a structured summary
-        # This is simplified - you may want to enhance parsing
-        opportunities = [{
+        data, result_text = crew_output_json(crew_result)
+
+        if data is None:
+            logger.warning("Could not parse opportunities as JSON")
+        else:
+            try:
+                analysis = OpportunityAnalysis(**data)
+                return [opp.model_dump() for opp in analysis.opportunities]
+            except (ValueError, TypeError) as e:
+                # pydantic's ValidationError is a ValueError subclass
+                logger.warning("Opportunities did not match the expected schema: %s", e)
+
+        return [{
             'raw_analysis': result_text,
             'tool_count': len(enriched_tools),
             'tools_analyzed': [t['name'] for t in enriched_tools]
         }]
 
-        # TODO: Enhanced parsing to extract individual opportunities
-        # For now, the report writer will work with the raw analysis
-
-        return opportunities
-
 
 def analyze_integration_opportunities(
     enriched_tools: List[Dict[str, Any]],
@@ -192,16 +347,17 @@ def analyze_integration_opportunities(
 ) -> List[Dict[str, Any]]:
     """
     Convenience function for integration analysis
-    Can be called synchronously
+    Synchronous wrapper - from async code, await
+    IntegrationAnalyzer.analyze_stack() directly instead
     """
-    import asyncio
-
-    analyzer = IntegrationAnalyzer()
-
-    # Run async function in sync context
-    if asyncio.get_event_loop().is_running():
-        # Already in async context
-        return asyncio.create_task(analyzer.analyze_stack(enriched_tools, client_name))
-    else:
-        # Create new event loop
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running: safe to drive the coroutine to completion here
+        analyzer = IntegrationAnalyzer()
         return asyncio.run(analyzer.analyze_stack(enriched_tools, client_name))
+
+    raise RuntimeError(
+        "analyze_integration_opportunities() cannot be called from a running "
+        "event loop; await IntegrationAnalyzer().analyze_stack(...) instead"
+    )
@@ -0,0 +1,50 @@
+"""
+Shared LLM client - one pooled ChatOpenAI per (model, temperature)
+Lets every agent in the process reuse the same HTTP connections
+"""
+
+from functools import lru_cache
+import os
+
+import httpx
+from langchain_openai import ChatOpenAI
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Connection pool shared by all ChatOpenAI instances in the process. CrewAI
+# calls the LLM synchronously (from worker threads), so a sync client is what
+# gets used; httpx.Client is safe to share across threads.
+_POOL_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+
+@lru_cache(maxsize=None)
+def _http_client() -> httpx.Client:
+    """Keep-alive HTTP client reused for every OpenAI request"""
+    return httpx.Client(limits=_POOL_LIMITS, timeout=httpx.Timeout(600.0, connect=10.0))
+
+
+def get_llm(model: str = None, temperature: float = 1) -> ChatOpenAI:
+    """
+    Get the shared ChatOpenAI instance for a model/temperature pair
+
+    Built lazily on first use (ChatOpenAI validates the API key when it is
+    constructed) and then reused, so warm calls skip TCP/TLS setup.
+
+    Args:
+        model: Model name (defaults to OPENAI_MODEL, then gpt-5)
+        temperature: Sampling temperature
+
+    Returns:
+        Cached ChatOpenAI instance
+    """
+    return _cached_llm(model or os.getenv("OPENAI_MODEL", "gpt-5"), temperature)
+
+
+@lru_cache(maxsize=None)
+def _cached_llm(model: str, temperature: float) -> ChatOpenAI:
+    return ChatOpenAI(
+        model=model,
+        temperature=temperature,
+        http_client=_http_client()
+    )
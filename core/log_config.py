@@ -0,0 +1,68 @@
+"""
+Logging setup - quiet-by-default agent output with structured step logs
+CrewAI's verbose mode prints every step synchronously; instead agents log
+their steps to the "tsat" logger, which is drained on a background thread
+"""
+
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from typing import Any, Optional
+import atexit
+import logging
+import os
+import queue
+
+# Set TSAT_VERBOSE=1 to get CrewAI's own step-by-step console output back
+VERBOSE = os.getenv("TSAT_VERBOSE", "0") == "1"
+
+logger = logging.getLogger("tsat")
+
+# Records buffered before being handed to the console writer; flushed
+# early on warnings and at phase boundaries (flush_logs)
+_BUFFER_CAPACITY = 100
+
+_listener: Optional[QueueListener] = None
+_buffer: Optional[MemoryHandler] = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Route "tsat" log records through a queue to a background console writer
+
+    Callers only pay for appending a record to an in-memory buffer; batches
+    are queued to the listener thread, which does the formatting and the
+    stdout writes. Safe to call more than once.
+    """
+    global _listener, _buffer
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+    _buffer = MemoryHandler(
+        _BUFFER_CAPACITY,
+        flushLevel=logging.WARNING,
+        target=QueueHandler(log_queue)
+    )
+    logger.addHandler(_buffer)
+    logger.setLevel(level)
+    logger.propagate = False
+
+    _listener = QueueListener(log_queue, console, respect_handler_level=True)
+    _listener.start()
+    # At exit (last registered runs first): drain the buffer, then let the
+    # listener write out everything still queued
+    atexit.register(_listener.stop)
+    atexit.register(_buffer.flush)
+
+
+def flush_logs() -> None:
+    """Hand any buffered records to the console writer now"""
+    if _buffer is not None:
+        _buffer.flush()
+
+
+def log_step(step_output: Any) -> None:
+    """CrewAI step_callback: record one agent step"""
+    logger.info("agent step: %.500s", step_output)
@@ -3,36 +3,182 @@ Report Writer - CrewAI agent for generating client-ready markdown reports
 Synthesizes research findings and opportunities into a professional deliverable
 """
 
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 from crewai import Agent, Task, Crew
-from langchain_openai import ChatOpenAI
 import os
 from dotenv import load_dotenv
 
+from core.context_builder import (
+    format_tool_inventory, count_tokens, CONTEXT_TOKEN_BUDGET, HEAVY_DIVIDER
+)
+from core.llm_client import get_llm
+from core.log_config import VERBOSE, log_step, logger
+
 load_dotenv()
 
 
+# Static prompt scaffolding. Everything here must stay free of per-client or
+# per-run values (names, dates) so the prompt prefix hashes identically across
+# calls and the provider's prompt cache can serve it.
+_WRITER_ROLE = "Technology Consulting Report Writer"
+
+_WRITER_GOAL = "Create a professional, actionable tech stack audit report for the client"
+
+_WRITER_BACKSTORY = """You are an experienced technology consultant who writes clear, 
+            actionable reports for business clients. You excel at translating technical 
+            findings into business value. Your reports are well-structured, easy to scan, 
+            and focused on ROI and implementation guidance. You always highlight quick wins 
+            and provide specific next steps."""
+
+_REPORT_INSTRUCTIONS = """You are writing one section of a comprehensive tech stack audit report for the client named in CLIENT below, using the findings in CONTEXT. Other writers produce the remaining sections in parallel, so stay within your assigned section.
+
+FULL REPORT OUTLINE (for reference):
+# Tech Stack Audit Report: <CLIENT>
+## Executive Summary
+## Tools Analyzed
+## Integration Opportunities
+## Quick Wins
+## Implementation Roadmap
+## Next Steps
+
+REQUIREMENTS:
+- Use markdown formatting
+- Keep language professional but accessible
+- Focus on business value, not just features
+- Be specific about time savings and ROI
+- Include implementation complexity for each opportunity
+- Prioritize open-source solutions (n8n)
+"""
+
+# Report sections in document order. Each one is written by its own crew so
+# the LLM calls run concurrently; the results are stitched in _save_report.
+_REPORT_SECTIONS = (
+    ("Executive Summary", """- Brief overview of audit scope
+- Total tools analyzed
+- Key findings (2-3 sentences)
+- Total opportunities identified
+- Estimated total time savings"""),
+    ("Tools Analyzed", """For each tool in the TOOL INVENTORY above, include:
+- Tool name and category
+- Recent updates discovered (if any)
+- Key automation features added
+- Current utilization assessment"""),
+    ("Integration Opportunities", """Prioritized list of automation opportunities:
+- Opportunity name
+- Tools involved
+- Current manual process
+- Proposed n8n workflow
+- Time savings estimate
+- Implementation complexity
+- Priority ranking (High/Medium/Low)"""),
+    ("Quick Wins", """Identify 2-3 opportunities that can be implemented quickly (< 1 week) for immediate ROI."""),
+    ("Implementation Roadmap", """Phased approach:
+- Phase 1: Quick wins (Weeks 1-2)
+- Phase 2: Medium complexity (Weeks 3-6)
+- Phase 3: Advanced integrations (Weeks 7-12)"""),
+    ("Next Steps", """Specific action items with owners and timelines."""),
+)
+
+# Upper bound on section crews talking to the LLM provider at once
+_MAX_CONCURRENT_SECTIONS = int(os.getenv("TSAT_MAX_CONCURRENT_LLM", "4"))
+
+
+def _section_description(client_name: str, context: str, title: str, outline: str) -> str:
+    """
+    Section task prompt
+
+    The shared prefix (static instructions + context) comes first and only
+    the section directive differs, so sibling sections share one cacheable
+    prompt prefix.
+    """
+    return (
+        f"{_REPORT_INSTRUCTIONS}\n"
+        f"CLIENT: {client_name}\n\n"
+        f"CONTEXT:\n{context}\n\n"
+        f"YOUR SECTION: ## {title}\n"
+        f"{outline}\n\n"
+        f"Write ONLY the \"## {title}\" section now, starting with that heading.\n"
+    )
+
+
+def build_section_messages(client_name: str, context: str) -> List[Tuple[str, List[Dict[str, str]]]]:
+    """
+    Render every section prompt as plain chat messages, in document order
+
+    Mirrors what the CrewAI section agents send, for callers that talk to
+    the OpenAI API directly (e.g. the Batch API runner).
+    """
+    system = {
+        "role": "system",
+        "content": f"You are {_WRITER_ROLE}. {_WRITER_BACKSTORY}\nYour personal goal is: {_WRITER_GOAL}"
+    }
+    return [
+        (title, [system, {"role": "user", "content": _section_description(client_name, context, title, outline)}])
+        for title, outline in _REPORT_SECTIONS
+    ]
+
+
+def finalize_section(title: str, text: str) -> str:
+    """Trim a section's output and make sure it starts with its heading"""
+    section = text.strip()
+    if not section.startswith("#"):
+        section = f"## {title}\n\n{section}"
+    return section
+
+
+# Cheaper model used to condense an oversized raw analysis before it is
+# embedded in every (expensive) section prompt
+_SUMMARY_MODEL = os.getenv("TSAT_SUMMARY_MODEL", "gpt-4o-mini")
+
+_SUMMARY_PROMPT = """Condense the following integration analysis to at most {max_tokens} tokens.
+Keep every opportunity with its tools, proposed n8n workflow, time savings,
+complexity and prerequisites. Drop repetition and filler.
+
+ANALYSIS:
+{analysis}
+"""
+
+
+def _format_opportunity(rank: int, opp: Dict[str, Any]) -> str:
+    """Render one structured opportunity from the integration analyzer"""
+    return f"""Opportunity {rank}: {opp.get('name', 'Unnamed')} (Priority: {opp.get('priority', 'N/A')})
+  Tools: {', '.join(opp.get('tools', []))}
+  Current process: {opp.get('current_process', 'N/A')}
+  Proposed n8n workflow: {opp.get('n8n_workflow', 'N/A')}
+  Estimated time savings: {opp.get('time_savings_hours', 'N/A')} hours/week
+  Complexity: {opp.get('complexity', 'N/A')}
+  Prerequisites: {'; '.join(opp.get('prerequisites', [])) or 'None'}"""
+
+
 class ReportWriter:
     """
     CrewAI-powered report writer
     Generates professional markdown reports for clients
     """
 
+    # Output directories already created in this process
+    _ready_dirs: set = set()
+
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model=os.getenv("OPENAI_MODEL", "gpt-5"),
-            temperature=1  # GPT-5 only supports temperature=1
-        )
+        # Shared, connection-pooled client (GPT-5 only supports temperature=1)
+        self.llm = get_llm(temperature=1)
         self.output_dir = Path("output")
-        self.output_dir.mkdir(exist_ok=True)
+
+    def _ensure_output_dir(self) -> None:
+        """Create the output directory on first write (once per process)"""
+        if self.output_dir not in ReportWriter._ready_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            ReportWriter._ready_dirs.add(self.output_dir)
 
     async def generate_report(
         self,
         enriched_tools: List[Dict[str, Any]],
         opportunities: List[Dict[str, Any]],
-        client_name: str
+        client_name: str,
+        prebuilt_context: Optional[str] = None
     ) -> str:
         """
         Generate client-ready markdown report
@@ -41,197 +187,231 @@ class ReportWriter:
             enriched_tools: List of tools with research data
             opportunities: List of integration opportunities
             client_name: Name of client
+            prebuilt_context: Tool inventory from format_tool_inventory(),
+                shared with the integration analyzer (built here if omitted)
 
         Returns:
             Path to generated report file
         """
 
-        # Create the report writer agent
-        writer = Agent(
-            role="Technology Consulting Report Writer",
-            goal=f"Create a professional, actionable tech stack audit report for {client_name}",
-            backstory="""You are an experienced technology consultant who writes clear, 
-            actionable reports for business clients. You excel at translating technical 
-            findings into business value. Your reports are well-structured, easy to scan, 
-            and focused on ROI and implementation guidance. You always highlight quick wins 
-            and provide specific next steps.""",
-            llm=self.llm,
-            verbose=True
-        )
+        # One timestamp per report so the context date, filename and
+        # header can never disagree
+        now = datetime.now()
+
+        inventory = prebuilt_context
+        if inventory is None:
+            inventory = format_tool_inventory(enriched_tools)
+
+        # Keep the unstructured fallback analysis within the prompt budget
+        opportunities = await self._condense_raw_analysis(opportunities, inventory)
 
         # Prepare context
         context = self._prepare_report_context(
             enriched_tools,
             opportunities,
-            client_name
+            client_name,
+            inventory,
+            now=now
         )
 
-        # Create report writing task
-        report_task = Task(
-            description=f"""Create a comprehensive tech stack audit report for {client_name}.
+        # Write every section concurrently
+        limiter = asyncio.Semaphore(_MAX_CONCURRENT_SECTIONS)
+        sections = [
+            asyncio.create_task(
+                self._write_section(limiter, client_name, context, title, outline)
+            )
+            for title, outline in _REPORT_SECTIONS
+        ]
 
-CONTEXT:
-{context}
+        # Stream sections to file in document order as they complete
+        report_path = await self._save_report(sections, client_name, now=now)
 
-REPORT STRUCTURE REQUIRED:
-
-# Tech Stack Audit Report: {client_name}
-
-## Executive Summary
-- Brief overview of audit scope
-- Total tools analyzed
-- Key findings (2-3 sentences)
-- Total opportunities identified
-- Estimated total time savings
-
-## Tools Analyzed
-
-For each tool, include:
-- Tool name and category
-- Recent updates discovered (if any)
-- Key automation features added
-- Current utilization assessment
-
-## Integration Opportunities
-
-Prioritized list of automation opportunities:
-- Opportunity name
-- Tools involved
-- Current manual process
-- Proposed n8n workflow
-- Time savings estimate
-- Implementation complexity
-- Priority ranking (High/Medium/Low)
-
-## Quick Wins
-
-Identify 2-3 opportunities that can be implemented quickly (< 1 week) for immediate ROI.
-
-## Implementation Roadmap
-
-Phased approach:
-- Phase 1: Quick wins (Weeks 1-2)
-- Phase 2: Medium complexity (Weeks 3-6)
-- Phase 3: Advanced integrations (Weeks 7-12)
+        return str(report_path)
 
-## Next Steps
+    async def _condense_raw_analysis(
+        self,
+        opportunities: List[Dict[str, Any]],
+        inventory: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Summarize raw_analysis text with a smaller model if, together with
+        the inventory, it would exceed the context token budget
 
-Specific action items with owners and timelines.
+        Structured opportunities are already compact and are left alone.
+        """
+        raw_tokens = sum(
+            count_tokens(opp['raw_analysis'])
+            for opp in opportunities if 'raw_analysis' in opp
+        )
+        inventory_tokens = count_tokens(inventory)
+        if not raw_tokens or raw_tokens + inventory_tokens <= CONTEXT_TOKEN_BUDGET:
+            return opportunities
+
+        max_tokens = max(CONTEXT_TOKEN_BUDGET - inventory_tokens, 2000)
+        logger.warning(
+            "Raw analysis (%d tokens) plus inventory exceeds %d-token budget; "
+            "condensing with %s", raw_tokens, CONTEXT_TOKEN_BUDGET, _SUMMARY_MODEL
+        )
 
-REQUIREMENTS:
-- Use markdown formatting
-- Keep language professional but accessible
-- Focus on business value, not just features
-- Be specific about time savings and ROI
-- Include implementation complexity for each opportunity
-- Prioritize open-source solutions (n8n)
+        summarizer = get_llm(model=_SUMMARY_MODEL, temperature=0)
+        condensed = []
+        for opp in opportunities:
+            if 'raw_analysis' in opp:
+                prompt = _SUMMARY_PROMPT.format(max_tokens=max_tokens, analysis=opp['raw_analysis'])
+                response = await asyncio.to_thread(summarizer.invoke, prompt)
+                opp = {**opp, 'raw_analysis': response.content}
+            condensed.append(opp)
+
+        return condensed
+
+    def _create_writer(self) -> Agent:
+        """Create a report writer agent (one per section crew)"""
+        # Role, goal and backstory are kept client-agnostic so the system
+        # prompt is byte-identical across runs and eligible for provider-side
+        # prompt caching.
+        return Agent(
+            role=_WRITER_ROLE,
+            goal=_WRITER_GOAL,
+            backstory=_WRITER_BACKSTORY,
+            llm=self.llm,
+            verbose=VERBOSE,
+            step_callback=log_step
+        )
 
-Write the complete report now.
-""",
+    async def _write_section(
+        self,
+        limiter: asyncio.Semaphore,
+        client_name: str,
+        context: str,
+        title: str,
+        outline: str
+    ) -> str:
+        """Run a single-section crew off the event loop and return its markdown"""
+        writer = self._create_writer()
+        section_task = Task(
+            description=_section_description(client_name, context, title, outline),
             agent=writer,
-            expected_output="A complete markdown report ready for client delivery"
+            expected_output=f"The complete markdown '{title}' section of the report"
         )
 
-        # Run report generation
         crew = Crew(
             agents=[writer],
-            tasks=[report_task],
-            verbose=True
+            tasks=[section_task],
+            verbose=VERBOSE
         )
 
-        result = crew.kickoff()
-
-        # Save report to file
-        report_path = self._save_report(result, client_name)
+        # crew.kickoff() is blocking; run it in a worker thread so sibling
+        # sections (and any other coroutines) keep making progress
+        async with limiter:
+            result = await asyncio.to_thread(crew.kickoff)
 
-        return str(report_path)
+        return finalize_section(title, str(result))
 
     def _prepare_report_context(
         self,
         enriched_tools: List[Dict[str, Any]],
         opportunities: List[Dict[str, Any]],
-        client_name: str
+        client_name: str,
+        inventory: Optional[str] = None,
+        now: Optional[datetime] = None
     ) -> str:
         """Prepare formatted context for report generation"""
-
-        context_parts = [f"CLIENT: {client_name}\n"]
-        context_parts.append(
-            f"AUDIT DATE: {datetime.now().strftime('%B %d, %Y')}\n")
-        context_parts.append(f"TOTAL TOOLS: {len(enriched_tools)}\n\n")
-
-        # Tool details
-        context_parts.append("TOOL INVENTORY WITH FINDINGS:\n")
-        context_parts.append("=" * 70 + "\n\n")
-
-        for tool in enriched_tools:
-            context_parts.append(f"Tool: {tool['name']}\n")
-            context_parts.append(f"Category: {tool['category']}\n")
-            context_parts.append(f"Criticality: {tool['criticality']}\n")
-            context_parts.append(f"Users: {', '.join(tool['users'])}\n")
-
-            research = tool.get('research_result', {})
-            if research.get('success'):
-                updates = tool.get('analyzed_updates', [])
-                context_parts.append(f"Updates Found: {len(updates)}\n")
-
-                if updates:
-                    context_parts.append("Recent Updates:\n")
-                    for update in updates[:5]:  # Top 5
-                        context_parts.append(
-                            f"  - {update.get('feature_name', 'Unknown')}\n")
-                        context_parts.append(
-                            f"    Category: {update.get('update_category', 'N/A')}\n")
-                        context_parts.append(
-                            f"    Automation Potential: {update.get('automation_potential', 'Unknown')}\n")
-                        if update.get('business_impact'):
-                            context_parts.append(
-                                f"    Impact: {update['business_impact']}\n")
-            else:
-                context_parts.append(
-                    f"Research Status: {research.get('error', 'No updates found')}\n")
-
-            context_parts.append("\n" + "-" * 70 + "\n\n")
+        now = now or datetime.now()
+        if inventory is None:
+            inventory = format_tool_inventory(enriched_tools)
+
+        lines = [
+            f"CLIENT: {client_name}",
+            f"AUDIT DATE: {now:%B %d, %Y}",
+            f"TOTAL TOOLS: {len(enriched_tools)}",
+            "",
+            inventory,
+            "",
+            "INTEGRATION OPPORTUNITIES ANALYSIS:",
+            HEAVY_DIVIDER,
+            "",
+        ]
 
         # Integration opportunities
-        context_parts.append("\nINTEGRATION OPPORTUNITIES ANALYSIS:\n")
-        context_parts.append("=" * 70 + "\n\n")
-
+        rank = 0
         for opp in opportunities:
             if 'raw_analysis' in opp:
-                context_parts.append(opp['raw_analysis'])
-                context_parts.append("\n\n")
+                # Unstructured fallback from the analyzer
+                lines.append(opp['raw_analysis'])
+            elif 'name' in opp:
+                rank += 1
+                lines.append(_format_opportunity(rank, opp))
+            else:
+                continue
+            lines.append("")
 
-        return "".join(context_parts)
+        return "\n".join(lines) + "\n"
+
+    async def _save_report(
+        self,
+        sections: List["asyncio.Task[str]"],
+        client_name: str,
+        now: Optional[datetime] = None
+    ) -> Path:
+        """
+        Stream the report to a markdown file
+
+        The header is written up front and each section is appended in
+        document order as soon as it (and everything before it) is done,
+        so the file fills in while later sections are still being written.
+        It is written under a .part name and renamed into place once
+        complete, so a failed run never leaves a truncated report behind.
+        Disk I/O runs in worker threads to keep the event loop free.
+        """
 
-    def _save_report(self, crew_result: Any, client_name: str) -> Path:
-        """Save report to markdown file"""
+        now = now or datetime.now()
 
         # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
         safe_client_name = client_name.replace(" ", "_").replace("/", "_")
         filename = f"audit_{safe_client_name}_{timestamp}.md"
 
         report_path = self.output_dir / filename
-
-        # Extract report text
-        report_content = str(crew_result)
-
-        # Ensure proper markdown formatting
-        if not report_content.startswith("#"):
-            # Add header if agent didn't include it
-            header = f"# Tech Stack Audit Report: {client_name}\n\n"
-            header += f"**Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n\n"
-            header += "---\n\n"
-            report_content = header + report_content
-
-        # Write to file
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
-
-        print(f"📄 Report saved: {report_path}")
+        partial_path = report_path.with_name(f"{filename}.part")
+
+        # Sections never carry the document title, so always add the header
+        header = f"# Tech Stack Audit Report: {client_name}\n\n"
+        header += f"**Generated:** {now:%B %d, %Y at %I:%M %p}\n\n"
+        header += "---\n\n"
+
+        f = None
+        try:
+            await asyncio.to_thread(self._ensure_output_dir)
+            f = await asyncio.to_thread(open, partial_path, 'w', encoding='utf-8')
+            await asyncio.to_thread(f.write, header)
+            for i, section in enumerate(sections):
+                separator = "\n" if i == len(sections) - 1 else "\n\n"
+                chunk = await section + separator
+                await asyncio.to_thread(self._write_chunk, f, chunk)
+            await asyncio.to_thread(os.fsync, f.fileno())
+            await asyncio.to_thread(f.close)
+            await asyncio.to_thread(os.replace, partial_path, report_path)
+        except BaseException:
+            for section in sections:
+                section.cancel()
+            # Let the cancellations land so no task is left pending or
+            # holding an unretrieved exception
+            await asyncio.gather(*sections, return_exceptions=True)
+            if f is not None:
+                await asyncio.to_thread(f.close)
+                await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+            raise
+
+        logger.info("📄 Report saved: %s", report_path)
 
         return report_path
 
+    @staticmethod
+    def _write_chunk(f, chunk: str) -> None:
+        """Write and flush one chunk so readers see it immediately"""
+        f.write(chunk)
+        f.flush()
+
 
 def generate_markdown_report(
     enriched_tools: List[Dict[str, Any]],
@@ -240,20 +420,19 @@ def generate_markdown_report(
 ) -> str:
     """
     Convenience function for report generation
-    Can be called synchronously
+    Synchronous wrapper - from async code, await
+    ReportWriter.generate_report() directly instead
     """
-    import asyncio
-
-    writer = ReportWriter()
-
-    # Run async function in sync context
-    if asyncio.get_event_loop().is_running():
-        # Already in async context
-        return asyncio.create_task(
-            writer.generate_report(enriched_tools, opportunities, client_name)
-        )
-    else:
-        # Create new event loop
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running: safe to drive the coroutine to completion here
+        writer = ReportWriter()
         return asyncio.run(
             writer.generate_report(enriched_tools, opportunities, client_name)
         )
+
+    raise RuntimeError(
+        "generate_markdown_report() cannot be called from a running event "
+        "loop; await ReportWriter().generate_report(...) instead"
+    )
@@ -0,0 +1,101 @@
+"""
+Research Cache - SQLite-backed store for tool research results
+One indexed row per cache key instead of a JSON file per tool, so a hit is
+a single SELECT and a write a single UPSERT
+"""
+
+from typing import Dict, Optional, Tuple, Any
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+import sqlite3
+import threading
+import zlib
+
+import orjson
+
+
+DEFAULT_CACHE_DB = Path("data/research_cache.sqlite")
+
+_MEMO_SIZE = 256
+
+# Write generation per (database, key), shared by every ResearchCache in the
+# process: several instances (one per researcher, the page cache, Streamlit
+# sessions) open the same database, and a put() through any of them must
+# invalidate what the others have memoized
+_generations: Dict[Tuple[str, str], int] = {}
+_generations_lock = threading.Lock()
+
+
+class ResearchCache:
+    """
+    Key/value cache of research results with a cached_at timestamp
+    Payloads are stored as zlib-compressed JSON (orjson-encoded)
+    """
+
+    def __init__(self, db_path: Path = DEFAULT_CACHE_DB):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Researchers run concurrently from worker threads; one connection,
+        # serialized by a lock, is plenty for single-row reads and writes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS cache("
+                "key TEXT PRIMARY KEY, cached_at TEXT NOT NULL, payload BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+        # In-process memo of decompressed rows. Keyed on (key, generation)
+        # where the process-wide generation is bumped by put(), so a rewritten
+        # entry is never served stale and the old version simply ages out of
+        # the LRU.
+        self._db_id = str(self.db_path.resolve())
+        self._read = lru_cache(maxsize=_MEMO_SIZE)(self._read_row)
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], datetime]]:
+        """
+        Look up a cache entry
+
+        Repeat lookups within a process skip the database and decompression;
+        the payload is decoded afresh each time, so callers may modify it.
+
+        Returns:
+            (payload, cached_at) or None if the key is not cached
+        """
+        row = self._read(key, _generations.get((self._db_id, key), 0))
+        if row is None:
+            return None
+        payload, cached_at = row
+        return orjson.loads(payload), cached_at
+
+    def _read_row(self, key: str, generation: int) -> Optional[Tuple[bytes, datetime]]:
+        """Fetch and decompress one row from the database"""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT payload, cached_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        payload, cached_at = row
+        return zlib.decompress(payload), datetime.fromisoformat(cached_at)
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Insert or replace a cache entry, stamped with the current time"""
+        blob = zlib.compress(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO cache(key, cached_at, payload) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET "
+                "cached_at = excluded.cached_at, payload = excluded.payload",
+                (key, datetime.now().isoformat(), blob)
+            )
+            self._db.commit()
+        with _generations_lock:
+            gen_key = (self._db_id, key)
+            _generations[gen_key] = _generations.get(gen_key, 0) + 1
@@ -4,19 +4,171 @@ Automatically researches software updates using web search tools
 """
 
 import asyncio
+import hashlib
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-from pathlib import Path
-import json
+import os
+import random
+import re
+import threading
+import time
 
 from crewai import Agent, Task, Crew
 from crewai_tools import ScrapeWebsiteTool
 from crewai.tools import BaseTool
 # from langchain_community.tools import DuckDuckGoSearchResults
-from langchain_openai import ChatOpenAI
 from ddgs import DDGS
+from ddgs.exceptions import RatelimitException
+from openai import RateLimitError
+import orjson
+from pydantic import BaseModel, Field
+
+from core.api_changelog_registry import get_registry
+from core.crew_output import crew_output_json
+from core.research_cache import ResearchCache
+from core.llm_client import get_llm
+from core.log_config import VERBOSE, log_step, logger
+
+
+# Searches every web research run starts from. They are issued up front,
+# concurrently, instead of one at a time from inside the agent's tool loop.
+_SEARCH_QUERIES = (
+    "{tool_name} official website",
+    "{tool_name} company",
+    "{tool_name} release notes {year_start}",
+    "{tool_name} what's new {year_end}",
+    "{tool_name} changelog",
+    "{tool_name} updates {year_start}-{year_end}",
+    "{tool_name} blog",
+    "{tool_name} API updates {year_start}",
+    "{tool_name} developer updates",
+    "{tool_name} integration features",
+)
+
+_MAX_CONCURRENT_SEARCHES = 8
+
+# Snippets are only for picking pages to scrape; keep them short in prompts
+_SNIPPET_CHARS = 200
+
+# Outermost {...} block in an unstructured answer (first "{" to last "}")
+_JSON_BLOCK_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+
+# DuckDuckGo rate-limits by client IP after a handful of rapid queries, so
+# every search in the process draws from one token bucket and retries
+# rate-limit errors with exponential backoff
+_SEARCH_RATE_PER_SECOND = 1.0
+_SEARCH_BURST = 3
+_SEARCH_RETRIES = 5
+
+# LLM rate limits (429s) that survive the client's own retries back off
+# exponentially per tool instead of failing that tool's research outright
+_LLM_RETRIES = 4
+_LLM_BACKOFF_BASE = 0.5
+_LLM_BACKOFF_FACTOR = 2
+_LLM_BACKOFF_MAX = 30.0
+
+# Optional comma-separated proxy list to spread searches across IPs
+_DDGS_PROXIES = [p.strip() for p in os.getenv("DDGS_PROXIES", "").split(",") if p.strip()]
+
+
+class _TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a token is free"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+_search_bucket = _TokenBucket(_SEARCH_RATE_PER_SECOND, _SEARCH_BURST)
+
+
+async def _kickoff_with_backoff(crew: Crew) -> Any:
+    """
+    Run crew.kickoff() in a worker thread, retrying LLM rate-limit errors
+    with exponential backoff; other errors propagate immediately
+    """
+    for attempt in range(_LLM_RETRIES):
+        try:
+            return await asyncio.to_thread(crew.kickoff)
+        except RateLimitError:
+            if attempt == _LLM_RETRIES - 1:
+                raise
+            delay = min(_LLM_BACKOFF_BASE * _LLM_BACKOFF_FACTOR ** attempt, _LLM_BACKOFF_MAX)
+            delay += random.random() * _LLM_BACKOFF_BASE
+            logger.warning("LLM rate limited, retrying in %.1fs", delay)
+            await asyncio.sleep(delay)
+
+
+# Whitespace inside tool names becomes "_" in cache keys
+_NORM_TABLE = str.maketrans({' ': '_', '\t': '_'})
+
+
+def _released_within(update: Dict[str, Any], start_date: str, end_date: str) -> bool:
+    """Whether an update's YYYY[-MM[-DD]] release date falls in the window"""
+    released = str(update.get('release_date') or '')[:10]
+    if len(released) not in (4, 7, 10):
+        return False
+    n = len(released)
+    return start_date[:n] <= released <= end_date[:n]
+
+
+# Registry tools already reported as lacking prefetched changelog data
+# (warn once per tool per process)
+_API_FALLBACK_NOTED: set = set()
+
+
+# Vendor pages (blogs, changelogs) are often read for several tools in one
+# run, so scraped text is kept in the research cache for a week
+_PAGE_CACHE_TTL = timedelta(days=7)
+
+
+@lru_cache(maxsize=None)
+def _page_cache() -> ResearchCache:
+    return ResearchCache()
+
+
+class CachedScrapeTool(ScrapeWebsiteTool):
+    """ScrapeWebsiteTool that reuses pages scraped within _PAGE_CACHE_TTL"""
 
-from core.api_changelog_registry import APIChangelogRegistry
+    def _run(self, **kwargs: Any) -> Any:
+        website_url = kwargs.get('website_url', self.website_url)
+        if not website_url:
+            return super()._run(**kwargs)
+
+        key = "page:" + hashlib.blake2b(website_url.encode('utf-8'), digest_size=16).hexdigest()
+        cached = _page_cache().get(key)
+        if cached is not None:
+            page, cached_at = cached
+            if datetime.now() - cached_at < _PAGE_CACHE_TTL:
+                return page['text']
+
+        text = super()._run(**kwargs)
+        if text:
+            _page_cache().put(key, {'url': website_url, 'text': text})
+        return text
+
+
+@lru_cache(maxsize=None)
+def shared_scrape_tool() -> ScrapeWebsiteTool:
+    """One scrape tool per process, shared by all researchers"""
+    return CachedScrapeTool()
 
 
 class DuckDuckGoSearchTool(BaseTool):
@@ -25,28 +177,142 @@ class DuckDuckGoSearchTool(BaseTool):
 
     def _run(self, query: str) -> str:
         """Execute the search"""
-        print(f"   🔎 DuckDuckGo searching: '{query}'")  # Debug
         try:
-            results = DDGS().text(query, max_results=5)
-            # Debug
-            print(f"   📊 Got {len(results) if results else 0} results")
-
-            if not results:
-                return "No results found."
-
-            formatted = []
-            for r in results:
-                formatted.append(
-                    f"Title: {r.get('title', 'N/A')}\n"
-                    f"URL: {r.get('href', 'N/A')}\n"
-                    f"Snippet: {r.get('body', 'N/A')}\n"
-                )
-            return "\n---\n".join(formatted)
+            return self._format_results(self.search(query))
         except Exception as e:
             error_msg = f"Search error: {str(e)}"
             print(f"   ❌ {error_msg}")  # Debug
             return error_msg
 
+    async def _arun(self, query: str) -> str:
+        """
+        Execute the search without blocking the event loop
+
+        The ddgs client is synchronous, so the request runs in a worker
+        thread; concurrent research tasks overlap their network waits.
+        """
+        return await asyncio.to_thread(self._run, query)
+
+    def search(self, query: str) -> List[Dict[str, Any]]:
+        """
+        Raw search hits (title/href/body dicts), throttled and retried on
+        rate limits; raises if the search ultimately fails
+        """
+        print(f"   🔎 DuckDuckGo searching: '{query}'")  # Debug
+        for attempt in range(_SEARCH_RETRIES):
+            _search_bucket.acquire()
+            proxy = random.choice(_DDGS_PROXIES) if _DDGS_PROXIES else None
+            try:
+                return DDGS(proxy=proxy).text(query, max_results=5) or []
+            except RatelimitException:
+                delay = 2 ** attempt + random.random()
+                print(f"   ⏳ Rate limited, retrying in {delay:.1f}s")  # Debug
+                time.sleep(delay)
+
+        raise RatelimitException(f"rate limited after {_SEARCH_RETRIES} attempts")
+
+    @staticmethod
+    def _format_results(results: Optional[List[Dict[str, Any]]]) -> str:
+        """Render search hits as plain text for the agent"""
+        # Debug
+        print(f"   📊 Got {len(results) if results else 0} results")
+
+        if not results:
+            return "No results found."
+
+        formatted = []
+        for r in results:
+            formatted.append(
+                f"Title: {r.get('title', 'N/A')}\n"
+                f"URL: {r.get('href', 'N/A')}\n"
+                f"Snippet: {r.get('body', 'N/A')}\n"
+            )
+        return "\n---\n".join(formatted)
+
+
+class ResearchUpdate(BaseModel):
+    """A single discovered software update"""
+    feature_name: str = Field(description="Specific feature name")
+    release_date: str = Field(default="", description="YYYY-MM-DD, YYYY-MM or YYYY")
+    description: str = Field(default="", description="What the feature does")
+    source_url: str = Field(default="", description="Official announcement or documentation URL")
+    category: str = Field(default="feature", description="automation/integration/api/feature/mobile/security")
+    business_impact: str = Field(default="", description="How this helps businesses")
+
+
+class ResearchResult(BaseModel):
+    """Structured web research output for one tool"""
+    success: bool = True
+    tool_name: str = ""
+    source: str = "web_research"
+    updates: List[ResearchUpdate] = Field(default_factory=list)
+    research_notes: str = ""
+
+
+# Web research task prompt, filled in per tool with str.format_map
+_RESEARCH_PROMPT = '''Research software updates for {tool_name} from {year_start} to {year_end}.
+
+IMPORTANT: You have web search AND scrape tools available. Use them together to find REAL information.
+The standard searches have already been run for you; their results are in SEARCH RESULTS below.
+
+RESEARCH STRATEGY:
+1. First, understand what this tool is:
+   - Find the official website in SEARCH RESULTS
+   - **Scrape the official website to understand the product**
+   
+2. Find and READ update sources:
+   - Pick out release notes, "what's new", changelog, update and blog URLs from SEARCH RESULTS
+   - **For EVERY relevant URL you find, use the scrape tool to read the full page**
+   - Only search again if the results below miss an obvious source
+   
+3. **CRITICAL - How to use the scrape tool:**
+   - When search returns a blog post URL → Scrape that exact URL
+   - When you find a release notes page → Scrape it
+   - When you find a changelog → Scrape it
+   - DON'T rely only on search snippets - they're incomplete
+   - Example: Search finds "wealthbox.com/blog/new-feature" → Use scrape tool on that URL
+   
+4. Look for API and integration updates:
+   - Use the API, developer and integration results below
+   - **Scrape the developer documentation pages**
+
+WHAT TO FIND:
+- Major new features released
+- API enhancements or new endpoints
+- Integration capabilities (especially with other business tools)
+- Automation features
+- Mobile app updates
+- Security/compliance updates
+
+REQUIREMENTS FOR EACH UPDATE:
+- **Feature Name**: Specific name (not generic like "New Features")
+- **Date**: When it was released (month/year at minimum)
+- **Description**: What it does and why it matters (2-3 sentences)
+- **Source URL**: Link to official announcement or documentation
+- **Category**: automation/integration/api/feature/mobile/security
+
+WORKFLOW EXAMPLE:
+1. Search "Wealthbox blog" → Find https://wealthbox.com/blog
+2. Scrape https://wealthbox.com/blog → See list of posts
+3. Scrape individual post URLs like https://wealthbox.com/blog/wealthbox-ai
+4. Extract: feature name, date, description from the scraped content
+
+HONESTY REQUIREMENT:
+If you cannot find updates after searching AND scraping:
+- Try 3-4 different search queries
+- Scrape at least 3-5 relevant pages
+- Check if the tool is behind a login wall
+- If still no results, return "No public updates found"
+- DO NOT make up features or dates
+
+Tool Type Context: {tool_type}
+Research Depth: {research_depth}
+
+SEARCH RESULTS (JSON: each query maps to [title, url, snippet] entries):
+<search_results>
+{search_results}
+</search_results>'''
+
 
 class SoftwareUpdateResearchAgent:
     """
@@ -54,22 +320,34 @@ class SoftwareUpdateResearchAgent:
     Now with ACTUAL web search capability using custom tool!
     """
 
-    def __init__(self, llm_model: str = "gpt-5", cache_duration_days: int = 30):
-        self.api_registry = APIChangelogRegistry()
-        self.cache_dir = Path("data/research_cache")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    def __init__(
+        self,
+        llm_model: str = "gpt-5",
+        cache_duration_days: int = 30,
+        max_concurrent_searches: int = _MAX_CONCURRENT_SEARCHES
+    ):
+        self.api_registry = get_registry()
+        self.cache = ResearchCache()
         self.cache_duration = timedelta(days=cache_duration_days)
-        self.llm = ChatOpenAI(model=llm_model, temperature=1)
+        # Shared, connection-pooled client reused by every researcher instance
+        self.llm = get_llm(model=llm_model, temperature=1)
 
         # Initialize web search tools
         self.search_tool = DuckDuckGoSearchTool()  # ✅ Simple, clean
-        self.scrape_tool = ScrapeWebsiteTool()
-
-        # Initialize CrewAI agent with search tools
-        self.research_agent = self._create_research_agent()
+        self.scrape_tool = shared_scrape_tool()
+        # Searches all go to one host, so this is effectively a per-host cap.
+        # The semaphore is made per event loop (see _search_semaphore) so one
+        # researcher can serve several asyncio.run() calls, e.g. Streamlit reruns
+        self._max_concurrent_searches = max_concurrent_searches
+        self._search_sem: Optional[asyncio.Semaphore] = None
+        self._search_sem_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Research currently running, by cache key, so concurrent requests
+        # for the same tool and window share one run
+        self._inflight: Dict[str, asyncio.Future] = {}
 
     def _create_research_agent(self) -> Agent:
-        """Create research agent with web search tools"""
+        """Create a research agent with web search tools (one per research crew)"""
         return Agent(
             role='Software Update Research Specialist',
             goal='Find real, verifiable software updates from vendor websites and documentation',
@@ -85,55 +363,61 @@ class SoftwareUpdateResearchAgent:
             You are especially good at researching financial services and business tools.''',
             tools=[self.search_tool, self.scrape_tool],
             llm=self.llm,
-            verbose=True,
+            verbose=VERBOSE,
+            step_callback=log_step,
             allow_delegation=False
         )
 
     def _normalize_tool_name(self, tool_name: str) -> str:
         """Normalize tool name for cache key"""
-        return tool_name.lower().strip().replace(' ', '_')
+        return tool_name.strip().translate(_NORM_TABLE).lower()
 
-    def _load_cache(self, tool_name: str, date_range: tuple) -> Optional[Dict]:
-        """Load cached research results if available and not expired"""
-        cache_key = self._normalize_tool_name(tool_name)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
-        if not cache_file.exists():
-            return None
+    def _cache_key(self, tool_name: str, date_range: tuple) -> str:
+        """Cache key for a tool's research over a date range"""
+        start_date, end_date = date_range
+        return f"{self._normalize_tool_name(tool_name)}|{start_date}|{end_date}"
 
+    async def _load_cache(self, tool_name: str, date_range: tuple) -> Optional[Dict]:
+        """Load cached research results if available and not expired"""
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cached = json.load(f)
+            # SQLite I/O runs in a worker thread, off the event loop
+            cached = await asyncio.to_thread(
+                self.cache.get, self._cache_key(tool_name, date_range))
+            if cached is None:
+                return None
 
-            cached_time = datetime.fromisoformat(
-                cached.get('cached_at', '2000-01-01'))
+            results, cached_time = cached
             if datetime.now() - cached_time < self.cache_duration:
-                if cached.get('date_range') == list(date_range):
-                    print(
-                        f"   📦 Using cached results from {cached_time.strftime('%Y-%m-%d')}")
-                    return cached.get('results')
+                print(
+                    f"   📦 Using cached results from {cached_time.strftime('%Y-%m-%d')}")
+                return results
         except Exception as e:
             print(f"   ⚠️ Cache read error: {e}")
 
         return None
 
-    def _save_cache(self, tool_name: str, date_range: tuple, results: Dict):
+    async def _save_cache(self, tool_name: str, date_range: tuple, results: Dict):
         """Save research results to cache"""
-        cache_key = self._normalize_tool_name(tool_name)
-        cache_file = self.cache_dir / f"{cache_key}.json"
-
         try:
-            cache_data = {
-                'tool_name': tool_name,
-                'date_range': list(date_range),
-                'cached_at': datetime.now().isoformat(),
-                'results': results
-            }
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2, ensure_ascii=False)
+            await asyncio.to_thread(
+                self.cache.put, self._cache_key(tool_name, date_range), results)
         except Exception as e:
             print(f"   ⚠️ Cache write error: {e}")
 
+    async def get_cached_research(
+        self,
+        tool_name: str,
+        start_date: str,
+        end_date: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Cached research for a tool and date window, without researching
+
+        Returns:
+            The cached result, or None if missing or expired
+        """
+        return await self._load_cache(tool_name, (start_date, end_date))
+
     async def research_tool_updates(
         self,
         tool_name: str,
@@ -155,6 +439,119 @@ class SoftwareUpdateResearchAgent:
         Returns:
             Dictionary with discovered updates
         """
+        key = self._cache_key(tool_name, (start_date, end_date))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._research_tool_updates(
+                tool_name, tool_type, start_date, end_date, research_depth
+            ))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            print(f"\n⏳ {tool_name} is already being researched, waiting for that result")
+
+        # Shielded so one caller being cancelled doesn't cancel the shared run
+        return await asyncio.shield(task)
+
+    async def research_many(
+        self,
+        tools: List[Dict[str, Any]],
+        concurrency: int = 4,
+        max_tasks_per_minute: Optional[int] = None
+    ) -> List[Any]:
+        """
+        Research several tools concurrently
+
+        Args:
+            tools: research_tool_updates() keyword arguments, one dict per tool
+            concurrency: Max tools researched at once
+            max_tasks_per_minute: Optional cap on how often a new tool's
+                research may start, to stay under LLM provider rate limits
+
+        Returns:
+            Results in the same order as tools; a failed tool's entry is
+            the exception it raised
+        """
+        sem = asyncio.Semaphore(concurrency)
+        interval = 60.0 / max_tasks_per_minute if max_tasks_per_minute else 0.0
+        pace_lock = asyncio.Lock()
+        next_start = 0.0
+
+        async def _pace() -> None:
+            nonlocal next_start
+            async with pace_lock:
+                now = asyncio.get_running_loop().time()
+                wait = next_start - now
+                next_start = max(now, next_start) + interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+        async def _one(tool: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                if interval:
+                    await _pace()
+                return await self.research_tool_updates(**tool)
+
+        return await asyncio.gather(*(_one(t) for t in tools), return_exceptions=True)
+
+    async def research_tool_stack(
+        self,
+        tools: List[Dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        research_depth: str = "medium",
+        concurrency: int = 4
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Research a whole tool stack over one date window
+
+        Args:
+            tools: Tool dicts with at least 'name' and 'type'
+            start_date: Start date for research (YYYY-MM-DD)
+            end_date: End date for research (YYYY-MM-DD)
+            research_depth: 'quick', 'medium', or 'deep'
+            concurrency: Max tools researched at once
+
+        Returns:
+            Research result per tool name
+        """
+        results = await self.research_many(
+            [
+                {
+                    'tool_name': tool['name'],
+                    'tool_type': tool['type'],
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    'research_depth': research_depth
+                }
+                for tool in tools
+            ],
+            concurrency=concurrency
+        )
+
+        stack_results = {}
+        for tool, result in zip(tools, results):
+            if isinstance(result, BaseException):
+                print(f"   ❌ Research failed for {tool['name']}: {result}")
+                result = {
+                    'success': False,
+                    'tool_name': tool['name'],
+                    'error': str(result),
+                    'updates': []
+                }
+            stack_results[tool['name']] = result
+
+        return stack_results
+
+    async def _research_tool_updates(
+        self,
+        tool_name: str,
+        tool_type: str,
+        start_date: str,
+        end_date: str,
+        research_depth: str
+    ) -> Dict[str, Any]:
+        """Cache lookup, then API or web research for a single tool"""
         print(f"\n🔬 Researching updates for: {tool_name}")
         print(f"   Type: {tool_type}")
         print(f"   Date Range: {start_date} to {end_date}")
@@ -162,19 +559,37 @@ class SoftwareUpdateResearchAgent:
 
         # Check cache first
         date_range = (start_date, end_date)
-        cached_results = self._load_cache(tool_name, date_range)
+        cached_results = await self._load_cache(tool_name, date_range)
         if cached_results:
             return cached_results
 
-        # Step 1: Check if tool has API endpoint
+        # Step 1: Use changelog data already fetched into the API registry
+        endpoint_info = self.api_registry.get_endpoint(tool_name)
+        cached_updates = endpoint_info.get('cached_updates') if endpoint_info else None
+        if cached_updates:
+            cached_updates = [
+                u for u in cached_updates
+                if _released_within(u, start_date, end_date)
+            ]
+            print(f"   ✅ Using {len(cached_updates)} updates from the API registry")
+            registry_results = {
+                'success': True,
+                'source': 'registry',
+                'tool_name': tool_name,
+                'updates': cached_updates,
+                'has_api': True,
+                'endpoint': endpoint_info.get('endpoint')
+            }
+            await self._save_cache(tool_name, date_range, registry_results)
+            return registry_results
+
+        # Live API research is not implemented yet, so registry tools without
+        # prefetched data go straight to web research
         if self.api_registry.has_api_endpoint(tool_name):
-            print(f"   ✅ Found API endpoint in registry")
-            api_results = await self._research_via_api(tool_name, start_date, end_date)
-            if api_results['success']:
-                self._save_cache(tool_name, date_range, api_results)
-                return api_results
-            else:
-                print(f"   ⚠️ API research failed, falling back to web scraping")
+            tool_key = self._normalize_tool_name(tool_name)
+            if tool_key not in _API_FALLBACK_NOTED:
+                _API_FALLBACK_NOTED.add(tool_key)
+                print("   ⚠️ API endpoint known but no prefetched changelog, using web research")
         else:
             print(f"   ℹ️ No API endpoint found, using web research")
 
@@ -188,48 +603,31 @@ class SoftwareUpdateResearchAgent:
         )
 
         # Save to cache
-        self._save_cache(tool_name, date_range, web_results)
+        await self._save_cache(tool_name, date_range, web_results)
 
         return web_results
 
-    async def _research_via_api(
-        self,
-        tool_name: str,
-        start_date: str,
-        end_date: str
-    ) -> Dict[str, Any]:
-        """Research using API endpoint"""
-        endpoint_info = self.api_registry.get_endpoint(tool_name)
-
-        if not endpoint_info or not endpoint_info.get('endpoint'):
-            return {'success': False, 'error': 'No API endpoint available'}
-
-        try:
-            if endpoint_info['auth_required']:
-                print(f"   ⚠️ API requires authentication - check .env for credentials")
-                return {
-                    'success': False,
-                    'error': 'Authentication required but credentials not configured',
-                    'needs_setup': True
-                }
-
-            # Placeholder for actual API call logic
-            result = {
-                'success': True,
-                'source': 'api',
-                'tool_name': tool_name,
-                'endpoint': endpoint_info['endpoint'],
-                'updates_found': [],
-                'note': 'API integration not yet implemented - use web research'
-            }
-
-            return result
-
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e)
-            }
+    def _search_semaphore(self) -> asyncio.Semaphore:
+        """The search concurrency limit for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._search_sem_loop is not loop:
+            self._search_sem = asyncio.Semaphore(self._max_concurrent_searches)
+            self._search_sem_loop = loop
+        return self._search_sem
+
+    async def _search_one(self, query: str) -> Dict[str, Any]:
+        """Run one search, bounded by the shared concurrency limit"""
+        async with self._search_semaphore():
+            hits = await asyncio.to_thread(self.search_tool.search, query)
+            return {'query': query, 'results': hits}
+
+    async def _batch_search(self, queries: List[str]) -> List[Dict[str, Any]]:
+        """Run searches concurrently; failed queries are dropped"""
+        results = await asyncio.gather(
+            *(self._search_one(q) for q in queries),
+            return_exceptions=True
+        )
+        return [r for r in results if not isinstance(r, BaseException)]
 
     async def _research_via_web(
         self,
@@ -247,70 +645,36 @@ class SoftwareUpdateResearchAgent:
         year_start = start_date.split('-')[0]
         year_end = end_date.split('-')[0]
 
+        # Run the standard searches concurrently and hand the agent the
+        # results, so it starts reading pages instead of searching serially
+        queries = [
+            q.format(tool_name=tool_name, year_start=year_start, year_end=year_end)
+            for q in _SEARCH_QUERIES
+        ]
+        print(f"   🔍 Running {len(queries)} searches...")
+        search_results = await self._batch_search(queries)
+        # Compact form for the prompt: query -> [title, url, snippet] rows
+        search_dump = orjson.dumps({
+            r['query']: [
+                [hit.get('title', ''), hit.get('href', ''), hit.get('body', '')[:_SNIPPET_CHARS]]
+                for hit in r['results']
+            ]
+            for r in search_results
+        }).decode() if search_results else ""
+
+        # A fresh agent per run: CrewAI keeps executor state on the Agent, so
+        # concurrent kickoffs must not share one
+        researcher = self._create_research_agent()
         research_task = Task(
-            description=f'''Research software updates for {tool_name} from {year_start} to {year_end}.
-
-IMPORTANT: You have web search AND scrape tools available. Use them together to find REAL information.
-
-RESEARCH STRATEGY:
-1. First, understand what this tool is:
-   - Search: "{tool_name} official website"
-   - Search: "{tool_name} company"
-   - **Scrape the official website to understand the product**
-   
-2. Find and READ update sources:
-   - Search: "{tool_name} release notes {year_start}"
-   - Search: "{tool_name} what's new {year_end}"
-   - Search: "{tool_name} changelog"
-   - Search: "{tool_name} updates {year_start}-{year_end}"
-   - Search: "{tool_name} blog"
-   - **For EVERY relevant URL you find, use the scrape tool to read the full page**
-   
-3. **CRITICAL - How to use the scrape tool:**
-   - When search returns a blog post URL → Scrape that exact URL
-   - When you find a release notes page → Scrape it
-   - When you find a changelog → Scrape it
-   - DON'T rely only on search snippets - they're incomplete
-   - Example: Search finds "wealthbox.com/blog/new-feature" → Use scrape tool on that URL
-   
-4. Look for API and integration updates:
-   - Search: "{tool_name} API updates {year_start}"
-   - Search: "{tool_name} developer updates"
-   - Search: "{tool_name} integration features"
-   - **Scrape the developer documentation pages**
-
-WHAT TO FIND:
-- Major new features released
-- API enhancements or new endpoints
-- Integration capabilities (especially with other business tools)
-- Automation features
-- Mobile app updates
-- Security/compliance updates
-
-REQUIREMENTS FOR EACH UPDATE:
-- **Feature Name**: Specific name (not generic like "New Features")
-- **Date**: When it was released (month/year at minimum)
-- **Description**: What it does and why it matters (2-3 sentences)
-- **Source URL**: Link to official announcement or documentation
-- **Category**: automation/integration/api/feature/mobile/security
-
-WORKFLOW EXAMPLE:
-1. Search "Wealthbox blog" → Find https://wealthbox.com/blog
-2. Scrape https://wealthbox.com/blog → See list of posts
-3. Scrape individual post URLs like https://wealthbox.com/blog/wealthbox-ai
-4. Extract: feature name, date, description from the scraped content
-
-HONESTY REQUIREMENT:
-If you cannot find updates after searching AND scraping:
-- Try 3-4 different search queries
-- Scrape at least 3-5 relevant pages
-- Check if the tool is behind a login wall
-- If still no results, return "No public updates found"
-- DO NOT make up features or dates
-
-Tool Type Context: {tool_type}
-Research Depth: {research_depth}''',
-            agent=self.research_agent,
+            description=_RESEARCH_PROMPT.format_map({
+                'tool_name': tool_name,
+                'year_start': year_start,
+                'year_end': year_end,
+                'tool_type': tool_type,
+                'research_depth': research_depth,
+                'search_results': search_dump or "No search results returned - use the search tool yourself."
+            }),
+            agent=researcher,
             expected_output='''A JSON object with this structure:
 {{
     "success": true/false,
@@ -327,62 +691,52 @@ Research Depth: {research_depth}''',
         }}
     ],
     "research_notes": "Summary of what was found and any challenges"
-}}'''
+}}''',
+            output_json=ResearchResult
         )
 
         try:
             print(f"   🔍 Starting web research with search tools...")
             crew = Crew(
-                agents=[self.research_agent],
+                agents=[researcher],
                 tasks=[research_task],
-                verbose=True
+                verbose=VERBOSE
             )
 
-            result = crew.kickoff()
-
-            # Parse the result - handle CrewOutput object
-            try:
-                # CrewOutput has a raw attribute with the actual output
-                if hasattr(result, 'raw'):
-                    output_str = result.raw
-                elif hasattr(result, 'output'):
-                    output_str = result.output
-                else:
-                    output_str = str(result)
-
-                # Try to extract JSON from the string
-                import re
-                json_match = re.search(r'\{.*\}', output_str, re.DOTALL)
-                if json_match:
-                    parsed = json.loads(json_match.group())
-                else:
-                    parsed = {'success': False,
-                              'error': 'Could not parse result as JSON'}
-
-                # Ensure required fields exist
-                if 'success' not in parsed:
-                    parsed['success'] = True
-                if 'tool_name' not in parsed:
-                    parsed['tool_name'] = tool_name
-                if 'source' not in parsed:
-                    parsed['source'] = 'web_research'
-                if 'updates' not in parsed:
-                    parsed['updates'] = []
-
-                print(
-                    f"   ✅ Research complete: {len(parsed.get('updates', []))} updates found")
-                return parsed
-
-            except json.JSONDecodeError as e:
-                print(f"   ⚠️ Could not parse research results as JSON: {e}")
+            # crew.kickoff() is blocking; run it in a worker thread so other
+            # research (and searches) keep making progress on the event loop
+            result = await _kickoff_with_backoff(crew)
+
+            # Validated output_json result first; otherwise scan the raw
+            # text for the outermost {...} block
+            parsed, output_str = crew_output_json(result)
+            if parsed is None:
+                json_match = _JSON_BLOCK_RE.search(output_str)
+                try:
+                    parsed = orjson.loads(json_match.group()) if json_match else None
+                except orjson.JSONDecodeError as e:
+                    print(f"   ⚠️ Could not parse research results as JSON: {e}")
+                    parsed = None
+            if not isinstance(parsed, dict):
                 return {
                     'success': False,
                     'tool_name': tool_name,
                     'source': 'web_research',
-                    'error': f'JSON parse error: {str(e)}',
-                    'raw_output': output_str[:500] if 'output_str' in locals() else str(result)[:500]
+                    'error': 'Could not parse result as JSON',
+                    'updates': [],
+                    'raw_output': output_str[:500]
                 }
 
+            # Ensure required fields exist
+            parsed.setdefault('success', True)
+            parsed.setdefault('tool_name', tool_name)
+            parsed.setdefault('source', 'web_research')
+            parsed.setdefault('updates', [])
+
+            print(
+                f"   ✅ Research complete: {len(parsed['updates'])} updates found")
+            return parsed
+
         except Exception as e:
             print(f"   ❌ Research failed: {str(e)}")
             return {
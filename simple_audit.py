@@ -6,19 +6,85 @@ Simple single-pass workflow: CSV → Research → Analyze → Report
 
 import asyncio
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Any
+from datetime import date
+from functools import lru_cache
+import re
+from typing import AsyncIterator, Dict, List, Any, Optional
 import sys
 
+import pandas as pd
+
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from core.csv_loader import load_input, convert_df_to_tool_inventory
+from core.csv_loader import load_input, prepare_input, convert_df_to_tool_records
 from core.tool_researcher import SoftwareUpdateResearchAgent
 from core.integration_analyzer import IntegrationAnalyzer
 from core.report_writer import ReportWriter
 from core.feature_analyzer import FeatureAnalyzer
+from core.context_builder import format_tool_inventory
+from core.log_config import configure_logging, flush_logs, logger
+
+
+# Upper bounds on tools researched and feature analyses running at once
+_MAX_CONCURRENT_RESEARCH = 4
+_MAX_CONCURRENT_ANALYSES = 32
+
+# (category substring, tool type) checked in order; first match wins
+_CATEGORY_RULES = (
+    ('crm', 'crm'),
+    ('portfolio', 'portfolio_management'),
+    ('research', 'research_platform'),
+    ('custod', 'custodial'),
+    ('trading', 'custodial'),
+    ('planning', 'financial_planning'),
+    ('communication', 'communication'),
+    ('video', 'communication'),
+    ('productivity', 'productivity_suite'),
+    ('office', 'productivity_suite'),
+    ('operation', 'operations'),
+    ('accounting', 'operations'),
+    ('compliance', 'compliance'),
+)
+
+_KEYWORD_TO_TYPE = dict(_CATEGORY_RULES)
+
+# One optional lookahead per rule, in rule order; each captures its keyword
+# if it appears anywhere in the category, so the first non-empty group is
+# the rule that wins
+_CATEGORY_RE = re.compile(
+    '^' + ''.join(f'(?=.*?({re.escape(keyword)}))?' for keyword, _ in _CATEGORY_RULES),
+    re.DOTALL
+)
+
+
+def _infer_tool_types(categories: pd.Series) -> pd.Series:
+    """
+    Infer tool types for a whole column of categories
+    A category gets the type of the first _CATEGORY_RULES keyword it
+    contains (case-insensitive), or 'unknown'
+    """
+    matches = categories.str.lower().str.extract(_CATEGORY_RE)
+    first_match = matches.bfill(axis=1).iloc[:, 0]
+    return first_match.map(_KEYWORD_TO_TYPE).fillna('unknown')
+
+
+@lru_cache(maxsize=256)
+def _infer_tool_type(category: str) -> str:
+    """
+    Infer the tool type for a single category, as _infer_tool_types does
+    Categories repeat, so results are memoized
+    """
+    keyword = next(filter(None, _CATEGORY_RE.search(category.lower()).groups()), None)
+    return _KEYWORD_TO_TYPE.get(keyword, 'unknown')
+
+
+@lru_cache(maxsize=8)
+def _window(years: int, today: date) -> tuple[str, str]:
+    """Research window ending today, as YYYY-MM-DD strings (fixed within a day)"""
+    start_date = date(today.year - years, today.month, today.day)
+    return start_date.strftime("%Y-%m-%d"), today.strftime("%Y-%m-%d")
 
 
 class TechStackAudit:
@@ -27,171 +93,335 @@ class TechStackAudit:
     Runs complete workflow from CSV to final report
     """
     
-    def __init__(self, research_window_years: int = 2):
+    def __init__(
+        self,
+        research_window_years: int = 2,
+        stream_research: bool = True,
+        max_concurrency: int = _MAX_CONCURRENT_RESEARCH,
+        per_host: Optional[int] = None,
+        skip_unknown_types: bool = True
+    ):
+        """
+        Args:
+            research_window_years: Years of history to research
+            stream_research: Analyze each tool as soon as its research finishes
+            max_concurrency: Max tools researched at once
+            per_host: Max concurrent web searches (the researcher's default if None)
+            skip_unknown_types: Don't research tools whose category maps to 'unknown'
+        """
         self.research_window_years = research_window_years
-        self.research_agent = SoftwareUpdateResearchAgent()
+        self.stream_research = stream_research
+        self.skip_unknown_types = skip_unknown_types
+        self.max_concurrency = max_concurrency
+        self.research_agent = (
+            SoftwareUpdateResearchAgent(max_concurrent_searches=per_host)
+            if per_host else SoftwareUpdateResearchAgent()
+        )
         self.feature_analyzer = FeatureAnalyzer()
         self.integration_analyzer = IntegrationAnalyzer()
         self.report_writer = ReportWriter()
         
     def _calculate_date_window(self) -> tuple[str, str]:
         """Calculate start and end dates for research"""
-        end_date = datetime.now()
-        start_date = datetime(
-            end_date.year - self.research_window_years,
-            end_date.month,
-            end_date.day
-        )
-        return start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d")
+        return _window(self.research_window_years, date.today())
     
     async def run_audit(
         self, 
-        csv_path: str, 
+        csv_path: Optional[str], 
         client_name: str,
-        research_depth: str = "medium"
+        research_depth: str = "medium",
+        df: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Complete audit workflow
         
         Args:
-            csv_path: Path to CSV file with tool inventory
+            csv_path: Path to CSV file with tool inventory (None when df is given)
             client_name: Name of client for report
             research_depth: 'quick', 'medium', or 'deep'
+            df: Already-loaded tool inventory; when given, csv_path is not read
             
         Returns:
             Path to generated report file
         """
-        print("\n" + "="*60)
-        print("🚀 TECH STACK AUDIT - Starting")
-        print("="*60)
-        print(f"   Client: {client_name}")
-        print(f"   Research window: {self.research_window_years} years")
-        print(f"   Research depth: {research_depth}")
-        print("="*60 + "\n")
+        logger.info(
+            "🚀 TECH STACK AUDIT - Starting | client: %s | research window: %d years | depth: %s",
+            client_name, self.research_window_years, research_depth
+        )
         
         # PHASE 1: Load CSV and research all tools
-        print("\n" + "="*60)
-        print("📋 PHASE 1: TOOL RESEARCH")
-        print("="*60)
+        logger.info("📋 PHASE 1: TOOL RESEARCH")
+        
+        enriched_tools = await self._research_phase(csv_path, research_depth, df=df)
         
-        enriched_tools = await self._research_phase(csv_path, research_depth)
+        logger.info("✅ Phase 1 complete: %d tools researched", len(enriched_tools))
+        flush_logs()
         
-        print(f"\n✅ Phase 1 complete: {len(enriched_tools)} tools researched\n")
+        # Format the tool inventory once; both LLM stages embed the same text
+        tool_inventory = format_tool_inventory(enriched_tools)
         
         # PHASE 2: Analyze integration opportunities
-        print("\n" + "="*60)
-        print("🔗 PHASE 2: INTEGRATION ANALYSIS")
-        print("="*60)
+        logger.info("🔗 PHASE 2: INTEGRATION ANALYSIS")
         
-        opportunities = await self._integration_phase(enriched_tools, client_name)
+        opportunities = await self._integration_phase(
+            enriched_tools, 
+            client_name,
+            tool_inventory
+        )
         
-        print(f"\n✅ Phase 2 complete: {len(opportunities)} opportunities identified\n")
+        logger.info("✅ Phase 2 complete: %d opportunities identified", len(opportunities))
+        flush_logs()
         
         # PHASE 3: Generate report
-        print("\n" + "="*60)
-        print("📄 PHASE 3: REPORT GENERATION")
-        print("="*60)
+        logger.info("📄 PHASE 3: REPORT GENERATION")
         
         report_path = await self._report_phase(
             enriched_tools, 
             opportunities, 
-            client_name
+            client_name,
+            tool_inventory
         )
         
-        print(f"\n✅ Phase 3 complete: Report saved to {report_path}\n")
+        logger.info("✅ Phase 3 complete: Report saved to %s", report_path)
         
         # Final summary
-        print("\n" + "="*60)
-        print("🎉 AUDIT COMPLETE")
-        print("="*60)
-        print(f"   Tools analyzed: {len(enriched_tools)}")
-        print(f"   Opportunities found: {len(opportunities)}")
-        print(f"   Report location: {report_path}")
-        print("="*60 + "\n")
+        logger.info(
+            "🎉 AUDIT COMPLETE | tools analyzed: %d | opportunities found: %d | report: %s",
+            len(enriched_tools), len(opportunities), report_path
+        )
+        flush_logs()
         
         return report_path
-    
+
+    async def run_batch_audits(
+        self,
+        jobs: List[tuple[str, str]],
+        research_depth: str = "medium"
+    ) -> List[str]:
+        """
+        Audit several clients, running Phases 2 and 3 through the OpenAI Batch API
+
+        Reports arrive within the batch completion window (up to 24h) rather
+        than minutes, so this is for scheduled runs, not interactive use.
+
+        Args:
+            jobs: List of (csv_path, client_name) tuples
+            research_depth: 'quick', 'medium', or 'deep'
+
+        Returns:
+            Paths to generated report files, in job order
+        """
+        from core.batch_runner import BatchReportRunner
+
+        logger.info("🚀 TECH STACK AUDIT - Batch mode (%d clients)", len(jobs))
+
+        # PHASE 1: research each client's stack (realtime)
+        researched = []
+        for csv_path, client_name in jobs:
+            logger.info("📋 PHASE 1: TOOL RESEARCH - %s", client_name)
+            enriched_tools = await self._research_phase(csv_path, research_depth)
+            researched.append((enriched_tools, client_name))
+            flush_logs()
+
+        # PHASES 2 + 3: analysis and report sections for all clients, batched
+        report_paths = await BatchReportRunner().run(researched)
+
+        logger.info("🎉 BATCH AUDIT COMPLETE")
+        for (_, client_name), report_path in zip(researched, report_paths):
+            logger.info("   %s: %s", client_name, report_path)
+        flush_logs()
+
+        return report_paths
+
     async def _research_phase(
         self, 
-        csv_path: str, 
-        research_depth: str
+        csv_path: Optional[str], 
+        research_depth: str,
+        df: Optional[pd.DataFrame] = None
     ) -> List[Dict[str, Any]]:
         """
         Phase 1: Load CSV and research all tools in parallel
         """
-        # Load tools from CSV
-        print(f"📂 Loading tools from: {csv_path}")
-        df = load_input(csv_path)
-        tool_inventory = convert_df_to_tool_inventory(df)
-        
-        print(f"✅ Loaded {len(tool_inventory)} tools from CSV\n")
-        
-        # Convert to research format
-        tools_to_research = []
-        for tool_name, tool_data in tool_inventory.items():
-            tools_to_research.append({
-                'name': tool_name,
-                'type': self._infer_tool_type(tool_data['category']),
-                'category': tool_data['category'],
-                'users': tool_data['users'],
-                'criticality': tool_data['criticality']
-            })
+        if df is None:
+            # Load tools from CSV
+            logger.info("📂 Loading tools from: %s", csv_path)
+            df = load_input(csv_path)
+        else:
+            df = prepare_input(df)
+        tools_to_research = convert_df_to_tool_records(df)
+        
+        logger.info("✅ Loaded %d tools from CSV", len(tools_to_research))
+        
+        # Infer every tool's type in one pass over the category column
+        tool_types = _infer_tool_types(
+            pd.Series([tool['category'] for tool in tools_to_research], dtype=object)
+        )
+        tools_to_research = [
+            {**tool, 'type': tool_type}
+            for tool, tool_type in zip(tools_to_research, tool_types)
+        ]
         
         # Calculate research window
         start_date, end_date = self._calculate_date_window()
         
-        print(f"🔬 Researching updates from {start_date} to {end_date}\n")
+        logger.info("🔬 Researching updates from %s to %s", start_date, end_date)
         
-        # Research all tools
-        research_results = await self.research_agent.research_tool_stack(
-            tools=tools_to_research,
-            start_date=start_date,
-            end_date=end_date,
-            research_depth=research_depth
-        )
+        # Split off tools whose research is already cached so they don't
+        # queue behind live research for a concurrency slot
+        cached = await asyncio.gather(*(
+            self.research_agent.get_cached_research(tool['name'], start_date, end_date)
+            for tool in tools_to_research
+        ))
+        research_results = {
+            tool['name']: result
+            for tool, result in zip(tools_to_research, cached)
+            if result
+        }
+        to_fetch = [tool for tool in tools_to_research if tool['name'] not in research_results]
         
-        # Enhance with feature analysis
-        enriched_tools = []
-        for tool in tools_to_research:
-            tool_name = tool['name']
-            research_data = research_results.get(tool_name, {})
-            
-            # Analyze features if updates found
-            analyzed_updates = []
-            if research_data.get('success') and research_data.get('updates'):
-                for update in research_data['updates']:
-                    analyzed = self.feature_analyzer.analyze_update(
-                        update, 
-                        tool['type']
-                    )
-                    analyzed_updates.append(analyzed)
-            
-            enriched_tools.append({
-                'name': tool_name,
-                'type': tool['type'],
-                'category': tool['category'],
-                'users': tool['users'],
-                'criticality': tool['criticality'],
-                'research_result': research_data,
-                'analyzed_updates': analyzed_updates,
-                'update_count': len(analyzed_updates)
-            })
+        logger.info("📦 %d tools cached, %d to research", len(research_results), len(to_fetch))
+        
+        if self.skip_unknown_types:
+            # Categories the type rules don't recognize aren't worth the
+            # LLM/search budget; record them as not researched
+            skipped = [tool for tool in to_fetch if tool['type'] == 'unknown']
+            if skipped:
+                logger.info(
+                    "⏭️  Skipping %d tools with unrecognized categories: %s",
+                    len(skipped), ", ".join(tool['name'] for tool in skipped)
+                )
+                research_results.update({
+                    tool['name']: {
+                        'success': False,
+                        'tool_name': tool['name'],
+                        'error': 'Unknown tool type - not researched',
+                        'updates': []
+                    }
+                    for tool in skipped
+                })
+                to_fetch = [tool for tool in to_fetch if tool['type'] != 'unknown']
+        
+        if self.stream_research:
+            # Each tool is analyzed as soon as its own research finishes,
+            # rather than after the slowest tool in the stack
+            analysis_sem = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+            enriched_by_name = {
+                enriched['name']: enriched
+                for enriched in await asyncio.gather(*(
+                    self._enrich_tool(tool, research_results[tool['name']], analysis_sem)
+                    for tool in tools_to_research
+                    if tool['name'] in research_results
+                ))
+            }
+            async for enriched in self._research_stream(
+                to_fetch, start_date, end_date, research_depth
+            ):
+                enriched_by_name[enriched['name']] = enriched
+            return [enriched_by_name[tool['name']] for tool in tools_to_research]
+        
+        # Research all uncached tools
+        if to_fetch:
+            research_results.update(await self.research_agent.research_tool_stack(
+                tools=to_fetch,
+                start_date=start_date,
+                end_date=end_date,
+                research_depth=research_depth,
+                concurrency=self.max_concurrency
+            ))
+        
+        # Enhance with feature analysis, all tools and updates at once
+        analysis_sem = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+        enriched_tools = list(await asyncio.gather(*(
+            self._enrich_tool(tool, research_results.get(tool['name'], {}), analysis_sem)
+            for tool in tools_to_research
+        )))
         
         return enriched_tools
     
+    async def _research_stream(
+        self,
+        tools_to_research: List[Dict[str, Any]],
+        start_date: str,
+        end_date: str,
+        research_depth: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Research and analyze tools, yielding each enriched tool as it completes
+        (completion order, not CSV order)
+        """
+        research_sem = asyncio.Semaphore(self.max_concurrency)
+        analysis_sem = asyncio.Semaphore(_MAX_CONCURRENT_ANALYSES)
+        
+        async def _research_one(tool: Dict[str, Any]) -> Dict[str, Any]:
+            async with research_sem:
+                research_results = await self.research_agent.research_tool_stack(
+                    tools=[tool],
+                    start_date=start_date,
+                    end_date=end_date,
+                    research_depth=research_depth
+                )
+            return await self._enrich_tool(tool, research_results[tool['name']], analysis_sem)
+        
+        # Real tasks so that, if one fails or the consumer stops early, the
+        # rest can be cancelled and awaited rather than left running unobserved
+        tasks = [asyncio.create_task(_research_one(tool)) for tool in tools_to_research]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                yield await finished
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _enrich_tool(
+        self,
+        tool: Dict[str, Any],
+        research_data: Dict[str, Any],
+        analysis_sem: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """Attach research results and feature analysis to one tool record"""
+        
+        async def _analyze(update: Dict) -> Dict:
+            async with analysis_sem:
+                return await asyncio.to_thread(
+                    self.feature_analyzer.analyze_update,
+                    update,
+                    tool['type']
+                )
+        
+        # Analyze features if updates found
+        analyzed_updates = []
+        if research_data.get('success') and research_data.get('updates'):
+            analyzed_updates = list(await asyncio.gather(
+                *(_analyze(update) for update in research_data['updates'])
+            ))
+        
+        return {
+            'name': tool['name'],
+            'type': tool['type'],
+            'category': tool['category'],
+            'users': tool['users'],
+            'criticality': tool['criticality'],
+            'research_result': research_data,
+            'analyzed_updates': analyzed_updates,
+            'update_count': len(analyzed_updates)
+        }
+    
     async def _integration_phase(
         self, 
         enriched_tools: List[Dict[str, Any]], 
-        client_name: str
+        client_name: str,
+        tool_inventory: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         Phase 2: Analyze integration opportunities across full stack
         """
-        print(f"🤖 Analyzing integration opportunities for {client_name}\n")
+        logger.info("🤖 Analyzing integration opportunities for %s", client_name)
         
         opportunities = await self.integration_analyzer.analyze_stack(
             enriched_tools=enriched_tools,
-            client_name=client_name
+            client_name=client_name,
+            prebuilt_context=tool_inventory
         )
         
         return opportunities
@@ -200,45 +430,26 @@ class TechStackAudit:
         self,
         enriched_tools: List[Dict[str, Any]],
         opportunities: List[Dict[str, Any]],
-        client_name: str
+        client_name: str,
+        tool_inventory: Optional[str] = None
     ) -> str:
         """
         Phase 3: Generate client-ready report
         """
-        print(f"✍️  Generating report for {client_name}\n")
+        logger.info("✍️  Generating report for %s", client_name)
         
         report_path = await self.report_writer.generate_report(
             enriched_tools=enriched_tools,
             opportunities=opportunities,
-            client_name=client_name
+            client_name=client_name,
+            prebuilt_context=tool_inventory
         )
         
         return report_path
     
     def _infer_tool_type(self, category: str) -> str:
         """Infer tool type from category"""
-        category_lower = category.lower()
-        
-        if 'crm' in category_lower:
-            return 'crm'
-        elif 'portfolio' in category_lower:
-            return 'portfolio_management'
-        elif 'research' in category_lower:
-            return 'research_platform'
-        elif 'custod' in category_lower or 'trading' in category_lower:
-            return 'custodial'
-        elif 'planning' in category_lower:
-            return 'financial_planning'
-        elif 'communication' in category_lower or 'video' in category_lower:
-            return 'communication'
-        elif 'productivity' in category_lower or 'office' in category_lower:
-            return 'productivity_suite'
-        elif 'operation' in category_lower or 'accounting' in category_lower:
-            return 'operations'
-        elif 'compliance' in category_lower:
-            return 'compliance'
-        else:
-            return 'unknown'
+        return _infer_tool_type(category)
 
 
 async def main():
@@ -270,31 +481,60 @@ async def main():
         default='medium',
         help='Research depth (default: medium)'
     )
-    
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Run analysis and reports through the OpenAI Batch API '
+             '(cheaper, results within 24h)'
+    )
+    parser.add_argument(
+        '--add-client',
+        nargs=2,
+        action='append',
+        default=[],
+        metavar=('CSV_PATH', 'CLIENT_NAME'),
+        help='Additional client to audit in the same batch (repeatable, needs --batch)'
+    )
+
     args = parser.parse_args()
-    
-    # Validate CSV exists
-    if not Path(args.csv_path).exists():
-        print(f"❌ Error: CSV file not found: {args.csv_path}")
+
+    configure_logging()
+
+    if args.add_client and not args.batch:
+        print("❌ Error: --add-client requires --batch")
         return 1
-    
+
+    jobs = [(args.csv_path, args.client_name)] + [tuple(c) for c in args.add_client]
+
+    # Validate CSVs exist
+    for csv_path, _ in jobs:
+        if not Path(csv_path).exists():
+            print(f"❌ Error: CSV file not found: {csv_path}")
+            return 1
+
     # Run audit
     audit = TechStackAudit(research_window_years=args.years)
-    
+
     try:
+        if args.batch:
+            report_paths = await audit.run_batch_audits(
+                jobs=jobs,
+                research_depth=args.depth
+            )
+            print(f"\n✅ Success! {len(report_paths)} reports written")
+            return 0
+
         report_path = await audit.run_audit(
             csv_path=args.csv_path,
             client_name=args.client_name,
             research_depth=args.depth
         )
-        
+
         print(f"\n✅ Success! Report available at: {report_path}")
         return 0
         
-    except Exception as e:
-        print(f"\n❌ Error during audit: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Error during audit")
         return 1
 
 
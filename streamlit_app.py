@@ -4,18 +4,41 @@ Tech Stack Audit Tool - Streamlit Dashboard
 Simple web interface for uploading CSVs and running audits
 """
 
-from simple_audit import TechStackAudit
 import streamlit as st
 import pandas as pd
 import asyncio
+import io
 from pathlib import Path
 from datetime import datetime
 import sys
 
-# Add project root to path
+# Add project root to path (once; Streamlit re-runs this script on every interaction)
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
+from core.log_config import configure_logging
+
+
+def _get_audit(years: int):
+    """
+    This session's TechStackAudit for a research window, kept across reruns
+
+    simple_audit pulls in CrewAI, LangChain and the OpenAI clients, so it is
+    only imported the first time an audit is actually run. Instances are
+    per session (not st.cache_resource) because concurrent sessions run
+    their audits on separate event loops.
+    """
+    from simple_audit import TechStackAudit
+
+    audits = st.session_state.setdefault('audits', {})
+    if years not in audits:
+        audits[years] = TechStackAudit(research_window_years=years)
+    return audits[years]
+
+
+# Audit progress goes to the server console through the background log writer
+configure_logging()
 
 # Page config
 st.set_page_config(
@@ -31,6 +54,8 @@ if 'report_path' not in st.session_state:
     st.session_state.report_path = None
 if 'report_content' not in st.session_state:
     st.session_state.report_content = None
+if 'input_df' not in st.session_state:
+    st.session_state.input_df = None
 
 # Header
 st.title("🔧 Tech Stack Audit Tool")
@@ -94,21 +119,14 @@ with col1:
     )
 
     if uploaded_file is not None:
-        # Save uploaded file temporarily
-        temp_dir = Path("data/temp")
-        temp_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        temp_csv_path = temp_dir / f"upload_{timestamp}.csv"
-
-        with open(temp_csv_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
-
         # Preview the CSV
         st.success(f"✅ File uploaded: {uploaded_file.name}")
 
         try:
-            df = pd.read_csv(temp_csv_path)
+            # Parse straight from the upload's in-memory buffer
+            df = pd.read_csv(io.BytesIO(uploaded_file.getbuffer()))
+            # Parsed once here and handed to the audit as-is
+            st.session_state.input_df = df
 
             st.subheader("📊 CSV Preview")
             st.dataframe(df, use_container_width=True)
@@ -136,31 +154,33 @@ with col1:
                             progress_bar = st.progress(0)
 
                             try:
-                                # Create audit instance
-                                audit = TechStackAudit(
-                                    research_window_years=years)
+                                # Get (or create) the audit instance
+                                audit = _get_audit(years)
 
                                 # Run audit
                                 progress_text.text(
                                     "Phase 1: Researching tools...")
                                 progress_bar.progress(33)
 
-                                # Run async audit
-                                report_path = asyncio.run(
-                                    audit.run_audit(
-                                        csv_path=str(temp_csv_path),
+                                # Run async audit and read the report back
+                                # off the main thread in the same event loop
+                                async def run_and_load():
+                                    path = await audit.run_audit(
+                                        csv_path=None,
                                         client_name=client_name,
-                                        research_depth=depth
+                                        research_depth=depth,
+                                        df=st.session_state.input_df
                                     )
-                                )
+                                    content = await asyncio.to_thread(
+                                        Path(path).read_text, encoding='utf-8')
+                                    return path, content
+
+                                report_path, report_content = asyncio.run(
+                                    run_and_load())
 
                                 progress_bar.progress(100)
                                 progress_text.text("✅ Audit complete!")
 
-                                # Read report content
-                                with open(report_path, 'r', encoding='utf-8') as f:
-                                    report_content = f.read()
-
                                 # Store in session state
                                 st.session_state.audit_complete = True
                                 st.session_state.report_path = report_path
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures: agents built without their clients, and a fake
+CrewAI that answers the way crewai itself does
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.crew_output import strip_code_fence
+
+
+@pytest.fixture
+def bare():
+    """
+    Build an instance without running __init__ (no LLM clients, searches
+    or cache files), setting only the attributes a test needs
+    """
+    def build(cls, **attrs):
+        obj = cls.__new__(cls)
+        for name, value in attrs.items():
+            setattr(obj, name, value)
+        return obj
+    return build
+
+
+class FakeCrewAI:
+    """
+    Agent/Task/Crew stand-ins whose kickoff() answers with .answer
+
+    kickoff() returns what crewai does: with output_json set on the last
+    task, the answer validated against that model and dumped to a dict
+    (crewai 0.28.8), or a CrewOutput-like object carrying raw, json_dict
+    and pydantic when crew_output is set (newer releases). Without
+    output_json, or when the answer doesn't validate, it is the raw text.
+    """
+
+    def __init__(self, monkeypatch):
+        self.monkeypatch = monkeypatch
+        self.answer: object = ""
+        self.crew_output = False
+        self.kickoffs = 0
+
+    def install(self, module) -> "FakeCrewAI":
+        """Replace module's Agent, Task and Crew"""
+        fake = self
+
+        class Crew:
+            def __init__(self, agents=(), tasks=(), **kwargs):
+                self.agents = list(agents)
+                self.tasks = list(tasks)
+
+            def kickoff(self):
+                return fake.kickoff(self.tasks[-1])
+
+        self.monkeypatch.setattr(module, 'Agent', lambda **kwargs: SimpleNamespace(**kwargs))
+        self.monkeypatch.setattr(module, 'Task', lambda **kwargs: SimpleNamespace(**kwargs))
+        self.monkeypatch.setattr(module, 'Crew', Crew)
+        return self
+
+    def kickoff(self, task):
+        self.kickoffs += 1
+        raw = self.answer if isinstance(self.answer, str) else orjson.dumps(self.answer).decode()
+
+        model = None
+        output_json = getattr(task, 'output_json', None)
+        if output_json is not None:
+            try:
+                model = output_json.model_validate_json(strip_code_fence(raw))
+            except ValueError:
+                model = None
+
+        if self.crew_output:
+            return SimpleNamespace(
+                raw=raw,
+                json_dict=model.model_dump() if model else None,
+                pydantic=model
+            )
+        return model.model_dump() if model else raw
+
+
+@pytest.fixture
+def fake_crewai(monkeypatch):
+    """FakeCrewAI; call .install(module) for each module under test"""
+    return FakeCrewAI(monkeypatch)
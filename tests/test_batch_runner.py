@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Batch API request building and result collection
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.batch_runner import BatchReportRunner
+
+
+class FakeBatchClient:
+    """
+    Stands in for AsyncOpenAI's files and batches APIs
+    Every request is answered with its own custom_id, except those listed
+    in fail_ids, which come back as errors
+    """
+
+    def __init__(self, fail_ids=()):
+        self.fail_ids = set(fail_ids)
+        self.uploaded = b""
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=self._retrieve_batch)
+
+    async def _create_file(self, file, purpose):
+        self.uploaded = file[1]
+        return SimpleNamespace(id="file-in")
+
+    async def _create_batch(self, input_file_id, endpoint, completion_window):
+        return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+
+    async def _retrieve_batch(self, batch_id):
+        return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    async def _file_content(self, file_id):
+        lines = []
+        # Output order is not guaranteed to match input order
+        for line in reversed(self.uploaded.splitlines()):
+            custom_id = orjson.loads(line)["custom_id"]
+            if custom_id in self.fail_ids:
+                record = {"custom_id": custom_id, "response": None,
+                          "error": {"message": "rate limited"}}
+            else:
+                record = {"custom_id": custom_id, "error": None, "response": {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": f"reply to {custom_id}"}}]}
+                }}
+            lines.append(orjson.dumps(record).decode())
+        return SimpleNamespace(text="\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def make_runner(bare):
+    def build(client: FakeBatchClient) -> BatchReportRunner:
+        return bare(BatchReportRunner, client=client, model="gpt-5", poll_interval=0)
+    return build
+
+
+def test_request_line(make_runner):
+    runner = make_runner(FakeBatchClient())
+    request = runner._request("0:analysis", [{"role": "user", "content": "hi"}], json_mode=True)
+    assert request["custom_id"] == "0:analysis"
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"]["response_format"] == {"type": "json_object"}
+    assert "response_format" not in runner._request("0:section:0", [])["body"]
+
+
+def test_results_keyed_by_custom_id(make_runner):
+    runner = make_runner(FakeBatchClient())
+    ids = ["0:analysis", "1:analysis", "0:section:0", "0:section:1", "1:section:0"]
+    requests = [runner._request(i, [{"role": "user", "content": i}]) for i in ids]
+
+    results = asyncio.run(runner._run_batch(requests))
+    assert results == {i: f"reply to {i}" for i in ids}
+
+
+def test_failed_requests_are_left_out(make_runner):
+    runner = make_runner(FakeBatchClient(fail_ids={"1:section:0"}))
+    requests = [runner._request(i, []) for i in ("0:section:0", "1:section:0")]
+
+    results = asyncio.run(runner._run_batch(requests))
+    assert results == {"0:section:0": "reply to 0:section:0"}
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the prompt tool-inventory formatting
+"""
+
+import sys
+from pathlib import Path
+
+import orjson
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.context_builder import (
+    _SUMMARY_DETAIL,
+    _format_tool_block,
+    count_tokens,
+    format_tool_inventory,
+)
+
+
+def make_tool(name: str, criticality: str) -> dict:
+    return {
+        'name': name,
+        'category': 'CRM',
+        'type': 'crm',
+        'users': ['Alice', 'Bob'],
+        'criticality': criticality,
+        'research_result': {'success': True, 'has_api': True, 'api_type': 'REST'},
+        'analyzed_updates': [
+            {
+                'feature_name': f'{name} feature {n}',
+                'update_category': 'api',
+                'automation_potential': 'high',
+                'automation_value': 'Removes a manual data entry step',
+            }
+            for n in range(5)
+        ],
+    }
+
+
+TOOLS = [make_tool('Redtail', 'critical'), make_tool('Calendly', 'low')]
+
+
+def tool_block(inventory: str, name: str) -> str:
+    return inventory.split(f'{name}\n', 1)[1].split('-' * 60, 1)[0]
+
+
+def test_within_budget_keeps_full_detail():
+    inventory = format_tool_inventory(TOOLS, token_budget=10**6)
+    assert 'Calendly feature 0' in inventory
+    assert 'Redtail feature 0' in inventory
+    assert 'Used by: Alice, Bob' in inventory
+
+
+def test_trims_least_critical_tool_first():
+    full = format_tool_inventory(TOOLS, token_budget=10**6)
+    inventory = format_tool_inventory(TOOLS, token_budget=count_tokens(full) - 1)
+
+    low = tool_block(inventory, 'Calendly')
+    assert 'Recent updates' not in low
+    assert 'Used by' in low
+    assert 'Recent updates' in tool_block(inventory, 'Redtail')
+    assert count_tokens(inventory) < count_tokens(full)
+
+
+def test_small_budget_reduces_every_tool_to_a_summary():
+    summaries = "\n".join(_format_tool_block(orjson.dumps(t), _SUMMARY_DETAIL) for t in TOOLS)
+    header = "TOOL INVENTORY WITH RECENT UPDATES:\n" + "=" * 60 + "\n\n"
+    inventory = format_tool_inventory(TOOLS, token_budget=count_tokens(header + summaries))
+
+    for name in ('Redtail', 'Calendly'):
+        block = tool_block(inventory, name)
+        assert 'Criticality' in block
+        assert 'Recent updates' not in block
+        assert 'Used by' not in block
+    assert 'omitted' not in inventory
+
+
+def test_budget_below_summaries_omits_least_critical_tools():
+    tools = TOOLS + [make_tool(f'Tool {n}', 'low') for n in range(20)]
+    budget = count_tokens(format_tool_inventory(TOOLS, token_budget=10**6)) // 2
+
+    inventory = format_tool_inventory(tools, token_budget=budget)
+    assert count_tokens(inventory) <= budget
+    assert 'Redtail\n' in inventory
+    assert inventory.rstrip().endswith('to fit the prompt budget')
+    omitted = int(inventory.rstrip().rsplit('\n', 1)[1].split()[1])
+    assert sum(f'Tool {n}\n' not in inventory for n in range(20)) + ('Calendly\n' not in inventory) == omitted
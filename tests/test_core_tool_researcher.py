@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Unit tests for reading web research results in core/tool_researcher.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from datetime import timedelta
+
+import orjson
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import core.tool_researcher as tool_researcher
+from core.api_changelog_registry import APIChangelogRegistry
+from core.research_cache import ResearchCache
+from core.tool_researcher import SoftwareUpdateResearchAgent
+from core.tool_researcher_final import SoftwareUpdateResearcher
+
+
+RESEARCH = {
+    'success': True,
+    'tool_name': 'Redtail CRM',
+    'source': 'web_research',
+    'updates': [{'feature_name': 'Bulk Contacts API', 'release_date': '2024-03'}],
+    'research_notes': 'Found on the vendor blog',
+}
+
+
+@pytest.fixture
+def research(bare, fake_crewai):
+    """Run web research for Redtail CRM with the model answering answer"""
+    fake_crewai.install(tool_researcher)
+
+    async def no_searches(queries):
+        return []
+
+    def run(answer, crew_output=False):
+        fake_crewai.answer = answer
+        fake_crewai.crew_output = crew_output
+        researcher = bare(
+            SoftwareUpdateResearchAgent,
+            llm=None, search_tool=None, scrape_tool=None,
+            _batch_search=no_searches
+        )
+        return asyncio.run(researcher._research_via_web(
+            'Redtail CRM', 'crm', '2023-01-01', '2025-01-01', 'medium'))
+    return run
+
+
+def test_validated_result(research):
+    result = research(RESEARCH)
+    assert result['success'] is True
+    assert result['updates'][0]['feature_name'] == 'Bulk Contacts API'
+    assert result['research_notes'] == 'Found on the vendor blog'
+
+
+def test_validated_crew_output_result(research):
+    fenced = "```json\n" + orjson.dumps(RESEARCH).decode() + "\n```"
+    result = research(fenced, crew_output=True)
+    assert result['updates'][0]['feature_name'] == 'Bulk Contacts API'
+
+
+def test_json_block_in_unvalidated_result(research):
+    # Doesn't match ResearchResult, so kickoff() hands back the text
+    result = research('Here is what I found:\n{"updates": [{"release_date": "2024"}]}')
+    assert result['success'] is True
+    assert result['tool_name'] == 'Redtail CRM'
+    assert result['updates'] == [{'release_date': '2024'}]
+
+
+def test_unparseable_result_still_has_updates(research):
+    result = research("I could not reach the vendor's site.")
+    assert result['success'] is False
+    assert result['updates'] == []
+
+
+@pytest.fixture
+def legacy_researcher(bare):
+    """SoftwareUpdateResearcher whose research just records its arguments"""
+    def build(calls):
+        async def record(tool_name, tool_type, start_date, end_date, research_depth):
+            calls.append((tool_name, start_date, end_date))
+            return {'success': True, 'tool_name': tool_name, 'updates': []}
+        return bare(SoftwareUpdateResearcher, _inflight={}, _research_tool_updates=record)
+    return build
+
+
+def test_legacy_researcher_stack_research(legacy_researcher):
+    calls = []
+    results = asyncio.run(legacy_researcher(calls).research_tool_stack(
+        [{'name': 'Foo', 'type': 'crm'}], '2023-01-01', '2025-01-01'))
+    assert results['Foo']['success'] is True
+    assert calls == [('Foo', '2023-01-01', '2025-01-01')]
+
+
+def test_legacy_researcher_lookback_years(legacy_researcher):
+    calls = []
+    asyncio.run(legacy_researcher(calls).research_tool_updates(
+        'Foo', 'crm', end_date='2025-06-30', lookback_years=1))
+    assert calls == [('Foo', '2024-06-30', '2025-06-30')]
+
+
+def test_prefetched_changelog_skips_the_crew(tmp_path, bare, fake_crewai):
+    changelog_dir = tmp_path / "api_changelogs"
+    changelog_dir.mkdir()
+    (changelog_dir / "slack.json").write_bytes(orjson.dumps({
+        'tool_name': 'Slack',
+        'updates': [
+            {'feature_name': 'Workflow Builder steps', 'release_date': '2024-05-14'},
+            {'feature_name': 'Huddles API', 'release_date': '2024'},
+            {'feature_name': 'Legacy bots retired', 'release_date': '2021-03'},
+        ],
+    }))
+
+    fake_crewai.install(tool_researcher)
+    researcher = bare(
+        SoftwareUpdateResearchAgent,
+        api_registry=APIChangelogRegistry(changelog_dir),
+        cache=ResearchCache(tmp_path / "cache.sqlite"),
+        cache_duration=timedelta(days=30),
+        _inflight={}
+    )
+
+    result = asyncio.run(researcher.research_tool_updates(
+        'Slack', 'communication', '2023-01-01', '2025-01-01'))
+    assert result['source'] == 'registry'
+    assert [u['feature_name'] for u in result['updates']] == ['Workflow Builder steps', 'Huddles API']
+
+    cached = asyncio.run(researcher.get_cached_research('Slack', '2023-01-01', '2025-01-01'))
+    assert cached == result
+    assert fake_crewai.kickoffs == 0
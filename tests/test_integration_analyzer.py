@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for reading the integration analyst's output
+"""
+
+import asyncio
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import orjson
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import core.integration_analyzer as integration_analyzer
+from core.integration_analyzer import IntegrationAnalyzer
+
+
+TOOLS = [{'name': 'Redtail CRM', 'category': 'CRM'}, {'name': 'Orion', 'category': 'Portfolio'}]
+
+ANALYSIS = {
+    'opportunities': [
+        {
+            'name': 'Account sync',
+            'tools': ['Redtail CRM', 'Orion'],
+            'current_process': 'New accounts are re-keyed into the CRM',
+            'n8n_workflow': 'Schedule Trigger -> HTTP Request (Orion) -> HTTP Request (Redtail)',
+            'time_savings_hours': 3,
+            'complexity': 'Medium',
+            'prerequisites': ['Orion API access'],
+            'priority': 'High',
+        }
+    ]
+}
+
+
+@pytest.fixture
+def analyze(tmp_path, bare, fake_crewai):
+    """Run the integration analysis with the model answering answer"""
+    fake_crewai.install(integration_analyzer)
+
+    def run(answer, crew_output=False):
+        fake_crewai.answer = answer
+        fake_crewai.crew_output = crew_output
+        analyzer = bare(
+            IntegrationAnalyzer,
+            llm=None,
+            plan_cache_dir=tmp_path / "plan_cache",
+            plan_cache_duration=timedelta(days=30)
+        )
+        return asyncio.run(analyzer.analyze_stack(TOOLS, "Acme Advisors", prebuilt_context="inventory"))
+    return run
+
+
+def test_validated_result_is_parsed_and_cached(analyze, fake_crewai, tmp_path):
+    opportunities = analyze(ANALYSIS)
+    assert [o['name'] for o in opportunities] == ['Account sync']
+    assert opportunities[0]['time_savings_hours'] == 3.0
+    assert len(list((tmp_path / "plan_cache").glob("*.json"))) == 1
+
+    # Same stack again: served from the plan cache
+    assert analyze("unused") == opportunities
+    assert fake_crewai.kickoffs == 1
+
+
+def test_validated_crew_output_result(analyze):
+    fenced = "```json\n" + orjson.dumps(ANALYSIS, option=orjson.OPT_INDENT_2).decode() + "\n```"
+    assert [o['name'] for o in analyze(fenced, crew_output=True)] == ['Account sync']
+
+
+def test_fenced_text_result(bare):
+    # Batch API runner: the model's message text, not a kickoff() result
+    text = "```json\n" + orjson.dumps(ANALYSIS, option=orjson.OPT_INDENT_2).decode() + "\n```"
+    opportunities = bare(IntegrationAnalyzer)._parse_opportunities(text, TOOLS)
+    assert [o['name'] for o in opportunities] == ['Account sync']
+
+
+def test_unparseable_result_falls_back_to_raw_analysis(analyze, tmp_path):
+    opportunities = analyze("Consider syncing Redtail with Orion.")
+    assert opportunities == [{
+        'raw_analysis': "Consider syncing Redtail with Orion.",
+        'tool_count': 2,
+        'tools_analyzed': ['Redtail CRM', 'Orion'],
+    }]
+    assert not (tmp_path / "plan_cache").exists()
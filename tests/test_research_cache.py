@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the SQLite research cache
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from core.research_cache import ResearchCache
+
+
+def test_get_missing_key(tmp_path):
+    cache = ResearchCache(tmp_path / "cache.sqlite")
+    assert cache.get("nope") is None
+
+
+def test_put_then_get_round_trips(tmp_path):
+    cache = ResearchCache(tmp_path / "cache.sqlite")
+    cache.put("tool", {"success": True, "updates": [{"feature_name": "API v2"}]})
+
+    payload, cached_at = cache.get("tool")
+    assert payload == {"success": True, "updates": [{"feature_name": "API v2"}]}
+    assert cached_at is not None
+
+
+def test_put_replaces_memoized_entry(tmp_path):
+    cache = ResearchCache(tmp_path / "cache.sqlite")
+    cache.put("tool", {"version": 1})
+    assert cache.get("tool")[0] == {"version": 1}
+
+    cache.put("tool", {"version": 2})
+    assert cache.get("tool")[0] == {"version": 2}
+
+
+def test_returned_payload_is_a_copy(tmp_path):
+    cache = ResearchCache(tmp_path / "cache.sqlite")
+    cache.put("tool", {"updates": [{"feature_name": "API v2"}]})
+
+    first, _ = cache.get("tool")
+    first["updates"][0]["analysis"] = {"priority": "high"}
+
+    second, _ = cache.get("tool")
+    assert second == {"updates": [{"feature_name": "API v2"}]}
+
+
+def test_write_through_one_instance_is_seen_by_another(tmp_path):
+    db_path = tmp_path / "cache.sqlite"
+    reader = ResearchCache(db_path)
+    writer = ResearchCache(db_path)
+
+    # Memoize the miss first, then write through the other instance
+    assert reader.get("tool") is None
+    writer.put("tool", {"version": 1})
+    assert reader.get("tool")[0] == {"version": 1}
+
+    writer.put("tool", {"version": 2})
+    assert reader.get("tool")[0] == {"version": 2}
+
+
+def test_generations_are_per_database(tmp_path):
+    first = ResearchCache(tmp_path / "first.sqlite")
+    second = ResearchCache(tmp_path / "second.sqlite")
+
+    first.put("tool", {"db": "first"})
+    assert second.get("tool") is None
+    assert first.get("tool")[0] == {"db": "first"}
@@ -6,6 +6,7 @@ Tests the complete end-to-end workflow
 
 import asyncio
 import sys
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -16,9 +17,16 @@ sys.path.insert(0, str(project_root))
 load_dotenv()
 
 from simple_audit import TechStackAudit
+from core.log_config import logger
 from core.csv_loader import load_input, convert_df_to_tool_inventory
 
 
+@lru_cache(maxsize=1)
+def shared_audit() -> TechStackAudit:
+    """One TechStackAudit (and its agents and clients) for every test that needs one"""
+    return TechStackAudit(research_window_years=2)
+
+
 def test_csv_loading():
     """Test 1: CSV Loading"""
     print("\n" + "="*60)
@@ -62,10 +70,8 @@ def test_csv_loading():
         print("\n✅ TEST 1 PASSED\n")
         return True, test_csv
         
-    except Exception as e:
-        print(f"❌ TEST 1 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST 1 FAILED")
         return False, None
 
 
@@ -87,23 +93,20 @@ async def test_quick_research():
     print(f"📂 Using: {csv_path}")
     
     try:
-        audit = TechStackAudit(research_window_years=2)
+        audit = shared_audit()
         
         # Load just first 2 tools for quick test
         df = load_input(csv_path)
         df_small = df.head(2)
         
-        # Save temporary CSV
-        temp_csv = Path("data/temp_test.csv")
-        df_small.to_csv(temp_csv, index=False)
-        
         print(f"\n🔬 Testing research on 2 tools...")
         print(f"   Tools: {', '.join(df_small['Tool Name'].tolist())}")
         
         # Run research phase only (not full audit)
         enriched_tools = await audit._research_phase(
-            str(temp_csv), 
-            research_depth="quick"
+            csv_path,
+            research_depth="quick",
+            df=df_small
         )
         
         print(f"\n✅ Research complete: {len(enriched_tools)} tools")
@@ -117,16 +120,11 @@ async def test_quick_research():
             else:
                 print(f"      Status: ⚠️  {tool.get('research_result', {}).get('error', 'Unknown')}")
         
-        # Cleanup
-        temp_csv.unlink()
-        
         print("\n✅ TEST 2 PASSED\n")
         return True
         
-    except Exception as e:
-        print(f"❌ TEST 2 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST 2 FAILED")
         return False
 
 
@@ -188,10 +186,8 @@ async def test_integration_analysis():
         print("\n✅ TEST 3 PASSED\n")
         return True
         
-    except Exception as e:
-        print(f"❌ TEST 3 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST 3 FAILED")
         return False
 
 
@@ -253,10 +249,8 @@ async def test_report_generation():
         print("\n✅ TEST 4 PASSED\n")
         return True
         
-    except Exception as e:
-        print(f"❌ TEST 4 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST 4 FAILED")
         return False
 
 
@@ -276,23 +270,21 @@ async def test_complete_workflow():
         return True
     
     try:
-        # Create small test CSV (3 tools)
+        # Small test stack (3 tools), passed in directly
         df = load_input(csv_path)
         df_small = df.head(3)
         
-        temp_csv = Path("data/temp_complete_test.csv")
-        df_small.to_csv(temp_csv, index=False)
-        
         print(f"📂 Running complete audit on 3 tools:")
         for tool_name in df_small['Tool Name'].tolist():
             print(f"   - {tool_name}")
         
         # Run complete audit
-        audit = TechStackAudit(research_window_years=2)
+        audit = shared_audit()
         report_path = await audit.run_audit(
-            csv_path=str(temp_csv),
+            csv_path=csv_path,
             client_name="Complete Test Client",
-            research_depth="quick"
+            research_depth="quick",
+            df=df_small
         )
         
         print(f"\n✅ Complete workflow finished!")
@@ -305,21 +297,22 @@ async def test_complete_workflow():
             print("   ❌ Report file missing!")
             return False
         
-        # Cleanup
-        temp_csv.unlink()
-        
         print("\n✅ TEST 5 PASSED\n")
         return True
         
-    except Exception as e:
-        print(f"❌ TEST 5 FAILED: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST 5 FAILED")
         return False
 
 
-async def run_all_tests():
-    """Run complete test suite"""
+async def run_all_tests(serial: bool = False):
+    """
+    Run complete test suite
+    
+    Tests 2-4 share no state and mostly wait on the network, so they run
+    concurrently (their output interleaves); pass serial=True to run them
+    one after another.
+    """
     print("\n" + "="*60)
     print("🧪 SIMPLIFIED AUDIT TOOL - TEST SUITE")
     print("="*60)
@@ -337,14 +330,25 @@ async def run_all_tests():
         # Test 1: CSV Loading (sync)
         results['csv_loading'], test_csv = test_csv_loading()
         
-        # Test 2: Quick Research
-        results['quick_research'] = await test_quick_research()
-        
-        # Test 3: Integration Analysis
-        results['integration_analysis'] = await test_integration_analysis()
-        
-        # Test 4: Report Generation
-        results['report_generation'] = await test_report_generation()
+        # Tests 2-4: Quick Research, Integration Analysis, Report Generation
+        independent_tests = {
+            'quick_research': test_quick_research,
+            'integration_analysis': test_integration_analysis,
+            'report_generation': test_report_generation
+        }
+        if serial:
+            for test_name, test in independent_tests.items():
+                results[test_name] = await test()
+        else:
+            outcomes = await asyncio.gather(
+                *(test() for test in independent_tests.values()),
+                return_exceptions=True
+            )
+            for test_name, outcome in zip(independent_tests, outcomes):
+                if isinstance(outcome, BaseException):
+                    print(f"❌ {test_name} raised: {outcome}")
+                    outcome = False
+                results[test_name] = outcome
         
         # Test 5: Complete Workflow
         results['complete_workflow'] = await test_complete_workflow()
@@ -372,13 +376,21 @@ async def run_all_tests():
             print("Review errors above")
             return 1
         
-    except Exception as e:
-        print(f"\n❌ TEST SUITE ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ TEST SUITE ERROR")
         return 1
 
 
 if __name__ == "__main__":
-    exit_code = asyncio.run(run_all_tests())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Simplified audit tool test suite')
+    parser.add_argument(
+        '--serial',
+        action='store_true',
+        help='Run tests one at a time (easier to read output when debugging)'
+    )
+    args = parser.parse_args()
+    
+    exit_code = asyncio.run(run_all_tests(serial=args.serial))
     sys.exit(exit_code)
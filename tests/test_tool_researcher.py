@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the agent-output parsing in tool_researcher.py
+"""
+
+import asyncio
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from tool_researcher import (
+    SoftwareUpdateResearchAgent,
+    Update,
+    _SEARCH_CACHE_MIN_LOOKUPS,
+    _extract_labelled_updates,
+)
+
+
+# Fields run together on numbered lines, with the agent's own preamble and
+# closing remarks around them; the line parser can't read this, so
+# _parse_agent_output falls back to the labelled extractor
+INLINE_AGENT_OUTPUT = """I searched Redtail's release notes, blog and API documentation.
+
+Update 1: Feature Name: Bulk Contacts API, Release Date: March 2024, Source URL: https://corporate.redtailtechnology.com/blog/bulk-api, Description: Create and update up to 500 contacts per request.
+Update 2: **Feature Name:** Webhook Subscriptions | **Release Date:** Q3 2024 | **Automation Value:** Push contact changes to other systems in real time
+
+Overall, Redtail has invested heavily in integrations this year.
+Note: some release notes sit behind the client portal and could not be checked.
+"""
+
+
+@pytest.fixture
+def parse(bare):
+    """Run the parser on an agent built without clients (it uses no agent state)"""
+    agent = bare(SoftwareUpdateResearchAgent)
+
+    def run(output_text: str):
+        return asyncio.run(agent._parse_agent_output(output_text, "Redtail CRM", "crm", "2023-01-01", "2025-01-01"))
+    return run
+
+
+def test_line_format(parse):
+    output = (
+        "Feature Name: Bulk Contacts API\n"
+        "Release Date: March 2024\n"
+        "Source URL: https://example.com/bulk\n"
+        "Description: Create contacts in bulk: up to 500 per call\n"
+        "Automation Value: Nightly imports without manual entry\n"
+        "---\n"
+        "Feature Name: Webhooks\n"
+        "Release Date: Q3 2024\n"
+    )
+    assert parse(output) == [
+        {
+            'feature_name': 'Bulk Contacts API',
+            'release_date': 'March 2024',
+            'source_url': 'https://example.com/bulk',
+            'description': 'Create contacts in bulk: up to 500 per call',
+            'automation_value': 'Nightly imports without manual entry',
+        },
+        {'feature_name': 'Webhooks', 'release_date': 'Q3 2024'},
+    ]
+
+
+def test_inline_fields_stop_at_end_of_line(parse):
+    assert parse(INLINE_AGENT_OUTPUT) == [
+        {
+            'feature_name': 'Bulk Contacts API',
+            'release_date': 'March 2024',
+            'source_url': 'https://corporate.redtailtechnology.com/blog/bulk-api',
+            'description': 'Create and update up to 500 contacts per request.',
+        },
+        {
+            'feature_name': 'Webhook Subscriptions',
+            'release_date': 'Q3 2024',
+            'automation_value': 'Push contact changes to other systems in real time',
+        },
+    ]
+
+
+def test_last_field_does_not_swallow_closing_remarks():
+    updates = _extract_labelled_updates(
+        "Feature Name: Bulk API Description: Adds bulk endpoints\n\n"
+        "Let me know if you would like more detail on any of these."
+    )
+    assert [u.description for u in updates] == ['Adds bulk endpoints']
+
+
+def test_no_updates_phrase(parse):
+    assert parse("After searching, no public updates found for Redtail CRM.") == []
+
+
+def test_unparseable_output(parse):
+    assert parse("Redtail is a CRM used by financial advisors.") == []
+
+
+def test_update_to_dict_drops_missing_fields():
+    update = Update(feature_name='Bulk Contacts API', release_date='March 2024')
+    assert update.to_dict() == {'feature_name': 'Bulk Contacts API', 'release_date': 'March 2024'}
+
+
+class FakeDDGS:
+    """Stands in for DDGS, counting the searches that reach it"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def text(self, query, max_results=5):
+        self.calls += 1
+        return [{'title': query, 'href': 'https://example.com', 'body': 'result'}]
+
+
+@pytest.fixture
+def search_agent(bare) -> SoftwareUpdateResearchAgent:
+    """An agent with just the search-cache state, searching FakeDDGS"""
+    return bare(
+        SoftwareUpdateResearchAgent,
+        _ddgs=FakeDDGS(),
+        _search_cache=OrderedDict(),
+        _search_cache_lock=threading.Lock(),
+        _search_lookups=0,
+        _search_hits=0,
+        _search_cache_enabled=True,
+        _search_cache_evaluated=False
+    )
+
+
+def test_repeat_search_served_from_cache(search_agent):
+    agent = search_agent
+    first = agent._search("Redtail API")
+    assert agent._search(" redtail api ") == first
+    assert agent._ddgs.calls == 1
+
+
+def test_search_cache_disabled_when_queries_never_repeat(search_agent):
+    agent = search_agent
+    for n in range(_SEARCH_CACHE_MIN_LOOKUPS):
+        agent._search(f"query {n}")
+
+    assert not agent._search_cache_enabled
+    assert not agent._search_cache
+
+
+def test_search_cache_disabled_when_deciding_lookup_is_a_hit(search_agent):
+    agent = search_agent
+    for n in range(_SEARCH_CACHE_MIN_LOOKUPS - 1):
+        agent._search(f"query {n}")
+    agent._search("query 0")  # a hit, but the ratio is still far too low
+
+    assert agent._search_cache_evaluated
+    assert not agent._search_cache_enabled
+
+
+def test_search_cache_kept_when_queries_repeat(search_agent):
+    agent = search_agent
+    for n in range(_SEARCH_CACHE_MIN_LOOKUPS):
+        agent._search(f"query {n % 10}")
+
+    assert agent._search_cache_evaluated
+    assert agent._search_cache_enabled
+    assert agent._ddgs.calls == 10
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Unit tests for tool-type inference from the CSV category column
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from simple_audit import TechStackAudit, _infer_tool_type, _infer_tool_types
+
+
+CATEGORIES = [
+    'CRM',
+    'Portfolio Management',
+    'Trading / Portfolio',         # 'portfolio' is checked before 'trading'
+    'Research Platform',
+    'Custodian',
+    'Financial Planning',
+    'Video Conferencing',
+    'Office Productivity',
+    'Accounting',
+    'Compliance Archiving',
+    'Marketing',
+    '',
+]
+
+EXPECTED = [
+    'crm',
+    'portfolio_management',
+    'portfolio_management',
+    'research_platform',
+    'custodial',
+    'financial_planning',
+    'communication',
+    'productivity_suite',
+    'operations',
+    'compliance',
+    'unknown',
+    'unknown',
+]
+
+
+def test_infer_tool_types():
+    types = _infer_tool_types(pd.Series(CATEGORIES, dtype=object))
+    assert types.tolist() == EXPECTED
+
+
+def test_infer_tool_type_matches_vectorized():
+    assert [_infer_tool_type(c) for c in CATEGORIES] == EXPECTED
+
+
+def test_audit_infer_tool_type(bare):
+    audit = bare(TechStackAudit)
+    assert [audit._infer_tool_type(c) for c in CATEGORIES] == EXPECTED
+
+
+def test_infer_tool_types_keeps_index():
+    categories = pd.Series(['crm', 'misc'], index=[7, 3], dtype=object)
+    assert _infer_tool_types(categories).to_dict() == {7: 'crm', 3: 'unknown'}
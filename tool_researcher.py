@@ -4,16 +4,240 @@ Automatically researches software updates using web search tools
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
+import hashlib
+import io
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import re
+from string import Template
+import threading
+import zlib
+from bs4 import BeautifulSoup
 from crewai import Agent, Task, Crew
-from crewai_tools import tool, ScrapeWebsiteTool
+from crewai_tools import tool
 from langchain_openai import ChatOpenAI
 from duckduckgo_search import DDGS
+import httpx
+import orjson
+
+from core.api_changelog_registry import get_registry
+from core.log_config import VERBOSE
+
+
+# Tools researched at once by research_tool_stack
+DEFAULT_MAX_CONCURRENCY = 5
+
+# DuckDuckGo throttles bursts from one client, so searches from all
+# concurrently running agents share this cap instead of a blanket pause
+# between tools
+_DDGS_MAX_CONCURRENT = 2
+_ddgs_slots = threading.BoundedSemaphore(_DDGS_MAX_CONCURRENT)
+
+# Phrases the agent uses when it found nothing; one case-insensitive pass
+# over the output instead of lowercasing it and scanning once per phrase
+_NO_UPDATES_RE = re.compile(
+    r'no public updates found|no updates found|could not find'
+    r'|no information available|no public changelog|no verifiable updates',
+    re.IGNORECASE
+)
+
+# Words in an output line's key -> the update field it fills. One dict probe
+# per word of the key instead of a chain of substring checks per line
+_KEY_MAP = {
+    'feature': 'feature_name',
+    'name': 'feature_name',
+    'date': 'release_date',
+    'released': 'release_date',
+    'url': 'source_url',
+    'source': 'source_url',
+    'description': 'description',
+    'automation': 'automation_value',
+    'value': 'automation_value',
+}
+_KEY_WORD_RE = re.compile(r'[a-z]+')
+
+# Looser pass for output that doesn't keep one "Key: value" per line (fields
+# run together on one line, markdown bold around the labels): each label
+# captures everything up to the next label or the end of its line
+_FIELD_LABELS = r'feature\s*name|release\s*date|source\s*url|description|automation\s*value'
+_FIELD_RE = re.compile(
+    rf'({_FIELD_LABELS})\W{{0,3}}:\**\s*(.*?)\s*(?=(?:{_FIELD_LABELS})\W{{0,3}}:|$)',
+    re.IGNORECASE | re.MULTILINE
+)
+_LABEL_FIELDS = {
+    'feature': 'feature_name',
+    'release': 'release_date',
+    'source': 'source_url',
+    'description': 'description',
+    'automation': 'automation_value',
+}
+
+# Task prompts, parsed once at import; only the placeholders change per call
+_RESEARCH_PROMPT = Template('''Research software updates for $tool_name from $year_start to $year_end.
 
-from core.api_changelog_registry import APIChangelogRegistry
+IMPORTANT: You have web search tools available. Use them to find REAL information from vendor websites.
+When you have several searches planned, run them together with "Search the web in batch".
+
+RESEARCH STRATEGY:
+1. First, understand what this tool is:
+   - Search: "$tool_name official website"
+   - Search: "$tool_name company"
+   
+2. Then search for updates and release notes:
+   - Search: "$tool_name release notes $year_start"
+   - Search: "$tool_name what's new $year_end"
+   - Search: "$tool_name changelog"
+   - Search: "$tool_name updates $year_start-$year_end"
+   
+3. Look for API and integration improvements:
+   - Search: "$tool_name API updates"
+   - Search: "$tool_name new features automation"
+   - Search: "$tool_name integration enhancements"
+
+WHAT TO FIND:
+Focus on features that enable automation:
+- New API endpoints or capabilities
+- Webhook support
+- Workflow automation features
+- Integration improvements
+- Data export/import enhancements
+- OAuth or authentication improvements
+- Real-time sync capabilities
+
+OUTPUT FORMAT:
+For EACH real update you find, provide:
+
+Feature Name: [Specific feature name from vendor]
+Release Date: [Actual date or quarter, e.g., "Q2 2024" or "March 2024"]
+Source URL: [Where you found this information]
+Description: [What specifically changed - be detailed]
+Automation Value: [How this helps automate work]
+
+---
+
+If after thorough searching you find NO public updates:
+State clearly: "No public updates found for $tool_name"
+Then explain:
+- What searches you performed
+- Possible reasons (login-required portal, no public changelog, etc.)
+
+CRITICAL RULES:
+- Only report information you actually found via web search
+- Include source URLs for everything
+- Be specific with feature names (not generic like "API improvements")
+- If you can't find something, say so honestly
+''')
+
+# Parsed cache entries kept in memory per agent, most recently used last
+_MEM_CACHE_SIZE = 256
+
+# Formatted search results kept per agent, keyed by normalised query, so the
+# same query from different tools' research doesn't go back to DuckDuckGo.
+# Once enough lookups are in, caching switches itself off if it rarely hits
+_SEARCH_CACHE_SIZE = 512
+_SEARCH_CACHE_TTL = timedelta(hours=1)
+_SEARCH_CACHE_MIN_LOOKUPS = 50
+_SEARCH_CACHE_MIN_HIT_RATIO = 0.2
+
+# Page fetches share one keep-alive connection pool per agent instead of a
+# fresh TCP + TLS handshake for every page the agent reads
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30)
+_HTTP_TIMEOUT = 15
+_SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.google.com/'
+}
+
+
+@lru_cache(maxsize=2048)
+def _norm(tool_name: str) -> str:
+    """Cache file name stem for a tool"""
+    return tool_name.lower().replace(' ', '_')
+
+
+def _split_queries(queries: str) -> List[str]:
+    """Queries from a JSON list, or one per line"""
+    try:
+        parsed = orjson.loads(queries)
+    except orjson.JSONDecodeError:
+        parsed = queries.splitlines()
+    if isinstance(parsed, str):
+        parsed = [parsed]
+    elif not isinstance(parsed, list):
+        parsed = [queries]
+    return [str(q).strip() for q in parsed if str(q).strip()]
+
+
+def _content_hash(results: Dict) -> bytes:
+    """Hash of a result's content, ignoring when it was produced"""
+    content = {k: v for k, v in results.items() if k != 'timestamp'}
+    return hashlib.blake2b(
+        orjson.dumps(content, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS),
+        digest_size=16
+    ).digest()
+
+
+def _read_cache_file(cache_file: Path) -> Optional[Dict]:
+    """
+    Read one cache file, or None if it does not exist
+    A plain .json file left by older versions is compressed in place on first read
+    """
+    if cache_file.exists():
+        return orjson.loads(zlib.decompress(cache_file.read_bytes()))
+
+    legacy_file = cache_file.with_suffix('')
+    if not legacy_file.exists():
+        return None
+    data = orjson.loads(legacy_file.read_bytes())
+    _write_cache_file(cache_file, data)
+    legacy_file.unlink()
+    return data
+
+
+def _write_cache_file(cache_file: Path, data: Dict) -> None:
+    """Write one cache file as zlib-compressed JSON"""
+    cache_file.write_bytes(
+        zlib.compress(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)))
+
+
+@dataclass(slots=True)
+class Update:
+    """One update parsed out of agent output; fields the agent left out stay None"""
+    feature_name: Optional[str] = None
+    release_date: Optional[str] = None
+    source_url: Optional[str] = None
+    description: Optional[str] = None
+    automation_value: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, str]:
+        """Plain dict of the fields that were found, as stored in research results"""
+        return {k: v for k, v in asdict(self).items() if v is not None}
+
+
+def _extract_labelled_updates(output_text: str) -> List[Update]:
+    """Collect updates by field label, starting a new one at each feature name"""
+    updates = []
+    update = Update()
+    for match in _FIELD_RE.finditer(output_text):
+        label = match.group(1).lower()
+        field = next(f for prefix, f in _LABEL_FIELDS.items() if label.startswith(prefix))
+        value = match.group(2).strip(' \t\r\n|*-,;')
+        if field == 'feature_name':
+            if update.feature_name:
+                updates.append(update)
+            update = Update()
+        setattr(update, field, value)
+    if update.feature_name:
+        updates.append(update)
+    return updates
 
 
 class SoftwareUpdateResearchAgent:
@@ -22,22 +246,127 @@ class SoftwareUpdateResearchAgent:
     Now with ACTUAL web search capability!
     """
 
-    def __init__(self, llm_model: str = "gpt-4", cache_duration_days: int = 30):
-        self.api_registry = APIChangelogRegistry()
+    def __init__(
+        self,
+        llm_model: str = "gpt-4",
+        cache_duration_days: int = 30,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        negative_cache_days: int = 7
+    ):
+        self.max_concurrency = max_concurrency
+        self.api_registry = get_registry()
         self.cache_dir = Path("data/research_cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_duration = timedelta(days=cache_duration_days)
+        # Results with no updates (nothing found, or research failed) are
+        # kept for a shorter time so a tool gets another look sooner
+        self.negative_cache_duration = timedelta(days=negative_cache_days)
+        # cache key -> (expires_at, results); spares re-reading and re-parsing
+        # the JSON file for tools looked up more than once in a process
+        self._mem_cache: "OrderedDict[Path, Tuple[datetime, Dict]]" = OrderedDict()
+        # cache file -> (content hash, cached_at) of this agent's last write,
+        # so re-saving an identical, still-fresh result skips the rewrite
+        # (bounded like the mem cache, oldest write dropped first)
+        self._written: "OrderedDict[Path, Tuple[bytes, datetime]]" = OrderedDict()
         self.llm = ChatOpenAI(model=llm_model, temperature=0.3)
 
         # Initialize web search tools
+        self._http = httpx.Client(
+            limits=_HTTP_LIMITS,
+            timeout=_HTTP_TIMEOUT,
+            headers=_SCRAPE_HEADERS,
+            follow_redirects=True
+        )
+        # One DuckDuckGo session per agent, reused by every search
+        self._ddgs = DDGS()
+        # query -> (expires_at, formatted results); searches run on several
+        # threads at once, hence the lock
+        self._search_cache: "OrderedDict[str, Tuple[datetime, str]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self._search_lookups = 0
+        self._search_hits = 0
+        self._search_cache_enabled = True
+        self._search_cache_evaluated = False
         self.search_tool = self._create_search_tool()
-        self.scrape_tool = ScrapeWebsiteTool()
-
-        # Initialize CrewAI agent with search tools
-        self.research_agent = self._create_research_agent()
+        # Fans a batch of queries out over the shared search slots
+        self._search_pool = ThreadPoolExecutor(max_workers=_DDGS_MAX_CONCURRENT)
+        self.batch_search_tool = self._create_batch_search_tool()
+        self.scrape_tool = self._create_scrape_tool()
+
+        # Idle crews, each with its own research agent (CrewAI keeps per-run
+        # executor state on the Agent, so concurrent runs must not share one).
+        # A run takes a crew, swaps in its task and hands it back, so at most
+        # max_concurrency are ever built
+        self._idle_crews: List[Crew] = []
+
+    def _search(self, query: str) -> str:
+        """One DuckDuckGo search, formatted for the agent, served from cache when possible"""
+        if not self._search_cache_enabled:
+            return self._run_search(query)
+
+        key = query.strip().lower()
+        cached = self._cached_search(key)
+        if cached is not None:
+            return cached
+
+        result = self._run_search(query)
+        if self._search_cache_enabled and not result.startswith("Search error"):
+            with self._search_cache_lock:
+                self._search_cache[key] = (datetime.now() + _SEARCH_CACHE_TTL, result)
+                self._search_cache.move_to_end(key)
+                if len(self._search_cache) > _SEARCH_CACHE_SIZE:
+                    self._search_cache.popitem(last=False)
+        return result
+
+    def _cached_search(self, key: str) -> Optional[str]:
+        """Fresh cached results for a query, updating the hit ratio"""
+        with self._search_cache_lock:
+            self._search_lookups += 1
+            entry = self._search_cache.get(key)
+            result = None
+            if entry is not None and datetime.now() < entry[0]:
+                self._search_hits += 1
+                self._search_cache.move_to_end(key)
+                result = entry[1]
+            elif entry is not None:
+                del self._search_cache[key]
+
+            if not self._search_cache_evaluated \
+                    and self._search_lookups >= _SEARCH_CACHE_MIN_LOOKUPS:
+                self._search_cache_evaluated = True
+                hit_ratio = self._search_hits / self._search_lookups
+                print(f"   🔎 Search cache hit ratio: {hit_ratio:.0%} over {self._search_lookups} searches")
+                if hit_ratio < _SEARCH_CACHE_MIN_HIT_RATIO:
+                    print("   🔎 Search cache disabled (too few repeat queries)")
+                    self._search_cache_enabled = False
+                    self._search_cache.clear()
+        return result
+
+    def _run_search(self, query: str) -> str:
+        """Query DuckDuckGo and format the top results"""
+        try:
+            # text() yields results lazily; drain it while holding the
+            # slot so the requests themselves are what gets capped
+            with _ddgs_slots:
+                results = list(self._ddgs.text(query, max_results=5) or [])
+            if not results:
+                return "No results found for this query."
+
+            formatted = []
+            for r in results:
+                formatted.append(
+                    f"Title: {r.get('title', 'N/A')}\n"
+                    f"URL: {r.get('href', 'N/A')}\n"
+                    f"Snippet: {r.get('body', 'N/A')}\n"
+                )
+            return "\n---\n".join(formatted)
+        except Exception as e:
+            return f"Search error: {str(e)}"
 
     def _create_search_tool(self):
         """Create DuckDuckGo search tool (free, no API key needed!)"""
+        search = self._search
+
         @tool("Search the web")
         def search_web(query: str) -> str:
             """
@@ -45,23 +374,80 @@ class SoftwareUpdateResearchAgent:
             Use this to find information about software updates, release notes, and new features.
             Returns top search results with titles, URLs, and snippets.
             """
+            return search(query)
+
+        return search_web
+
+    def _create_batch_search_tool(self):
+        """Create a search tool that runs several queries at once"""
+        search = self._search
+        pool = self._search_pool
+
+        @tool("Search the web in batch")
+        def search_web_batch(queries: str) -> str:
+            """
+            Run several DuckDuckGo searches at once.
+            Pass a JSON list of query strings (or one query per line).
+            Prefer this over repeated single searches when you have several queries planned.
+            Returns each query's top results under a "Results for:" heading.
+            """
+            query_list = _split_queries(queries)
+            if not query_list:
+                return "No queries given."
+            results = pool.map(search, query_list)
+            return "\n\n".join(
+                f"Results for: {query}\n{result}"
+                for query, result in zip(query_list, results)
+            )
+
+        return search_web_batch
+
+    def _create_scrape_tool(self):
+        """Create page reader tool backed by the agent's pooled HTTP client"""
+        http = self._http
+
+        @tool("Read website content")
+        def read_website(website_url: str) -> str:
+            """
+            Read the text content of a web page.
+            Use this to open vendor release notes, changelogs and blog posts found via search.
+            """
             try:
-                results = DDGS().text(query, max_results=5)
-                if not results:
-                    return "No results found for this query."
-
-                formatted = []
-                for r in results:
-                    formatted.append(
-                        f"Title: {r.get('title', 'N/A')}\n"
-                        f"URL: {r.get('href', 'N/A')}\n"
-                        f"Snippet: {r.get('body', 'N/A')}\n"
-                    )
-                return "\n---\n".join(formatted)
+                page = http.get(website_url)
+                text = BeautifulSoup(page.content, "html.parser").get_text()
+                text = '\n'.join(line for line in text.split('\n') if line.strip())
+                return ' '.join(word for word in text.split(' ') if word.strip())
             except Exception as e:
-                return f"Search error: {str(e)}"
+                return f"Scrape error: {str(e)}"
 
-        return search_web
+        return read_website
+
+    def close(self) -> None:
+        """Release pooled HTTP connections"""
+        self._http.close()
+        self._ddgs.__exit__(None, None, None)
+        self._search_pool.shutdown(wait=False)
+
+    async def __aenter__(self) -> "SoftwareUpdateResearchAgent":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _checkout_crew(self, task: Task) -> Crew:
+        """Take an idle crew (or build one with a fresh agent) and point it at task"""
+        if self._idle_crews:
+            crew = self._idle_crews.pop()
+            task.agent = crew.agents[0]
+            crew.tasks = [task]
+            return crew
+        agent = self._create_research_agent()
+        task.agent = agent
+        return Crew(agents=[agent], tasks=[task], verbose=VERBOSE)
+
+    def _checkin_crew(self, crew: Crew) -> None:
+        """Return a crew to the idle pool once its run has finished"""
+        self._idle_crews.append(crew)
 
     def _create_research_agent(self) -> Agent:
         """Create research agent with web search tools"""
@@ -79,42 +465,85 @@ class SoftwareUpdateResearchAgent:
             
             You are especially good at researching financial services and business tools.
             ''',
-            tools=[self.search_tool, self.scrape_tool],
-            verbose=True,
+            tools=[self.search_tool, self.batch_search_tool, self.scrape_tool],
+            verbose=VERBOSE,
             allow_delegation=False
         )
 
-    def _load_cache(self, tool_name: str, date_range: tuple) -> Optional[Dict]:
+    def _cache_path(self, tool_name: str, date_range: tuple) -> Path:
+        """Cache file for a tool and date range"""
+        return self.cache_dir / f"{_norm(tool_name)}_{date_range[0]}_{date_range[1]}.json.z"
+
+    async def _load_cache(self, tool_name: str, cache_file: Path) -> Optional[Dict]:
         """Load cached research results"""
-        cache_key = f"{tool_name.lower().replace(' ', '_')}_{date_range[0]}_{date_range[1]}"
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        entry = self._mem_cache.get(cache_file)
+        if entry is not None:
+            expires_at, results = entry
+            if datetime.now() < expires_at:
+                self._mem_cache.move_to_end(cache_file)
+                print(f"   💾 Using cached research for {tool_name}")
+                return results
+            del self._mem_cache[cache_file]
 
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    cached_time = datetime.fromisoformat(
-                        data.get('cached_at', '1970-01-01'))
-                    if datetime.now() - cached_time < self.cache_duration:
-                        print(f"   💾 Using cached research for {tool_name}")
-                        return data.get('results')
-            except Exception as e:
-                print(f"   ⚠️ Cache load error: {e}")
+        try:
+            # Disk reads run in a worker thread so other tools' research keeps
+            # moving while this one waits on the filesystem
+            data = await asyncio.to_thread(_read_cache_file, cache_file)
+            if data is not None:
+                cached_time = datetime.fromisoformat(
+                    data.get('cached_at', '1970-01-01'))
+                ttl = self._ttl(data.get('negative', False))
+                if datetime.now() - cached_time < ttl:
+                    print(f"   💾 Using cached research for {tool_name}")
+                    results = data.get('results')
+                    self._remember(cache_file, cached_time + ttl, results)
+                    return results
+        except Exception as e:
+            print(f"   ⚠️ Cache load error: {e}")
         return None
 
-    def _save_cache(self, tool_name: str, date_range: tuple, results: Dict) -> None:
-        """Save research results to cache"""
-        cache_key = f"{tool_name.lower().replace(' ', '_')}_{date_range[0]}_{date_range[1]}"
-        cache_file = self.cache_dir / f"{cache_key}.json"
+    def _ttl(self, negative: bool) -> timedelta:
+        """How long a cache entry stays fresh"""
+        return self.negative_cache_duration if negative else self.cache_duration
 
+    def _remember(self, cache_file: Path, expires_at: datetime, results: Dict) -> None:
+        """Keep a cache entry in memory until it expires, evicting the least recently used"""
+        self._mem_cache[cache_file] = (expires_at, results)
+        self._mem_cache.move_to_end(cache_file)
+        if len(self._mem_cache) > _MEM_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+
+    async def _save_cache(
+        self,
+        cache_file: Path,
+        tool_name: str,
+        date_range: tuple,
+        results: Dict
+    ) -> None:
+        """Save research results to cache"""
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'cached_at': datetime.now().isoformat(),
-                    'tool_name': tool_name,
-                    'date_range': date_range,
-                    'results': results
-                }, f, indent=2, ensure_ascii=False)
+            cached_time = datetime.now()
+            negative = not results.get('updates')
+            ttl = self._ttl(negative)
+            digest = _content_hash(results)
+            written = self._written.get(cache_file)
+            if written is not None and written[0] == digest \
+                    and cached_time - written[1] < ttl:
+                self._remember(cache_file, written[1] + ttl, results)
+                return
+
+            await asyncio.to_thread(_write_cache_file, cache_file, {
+                'cached_at': cached_time,
+                'tool_name': tool_name,
+                'date_range': date_range,
+                'negative': negative,
+                'results': results
+            })
+            self._written[cache_file] = (digest, cached_time)
+            self._written.move_to_end(cache_file)
+            if len(self._written) > _MEM_CACHE_SIZE:
+                self._written.popitem(last=False)
+            self._remember(cache_file, cached_time + ttl, results)
         except Exception as e:
             print(f"   ⚠️ Cache save error: {e}")
 
@@ -146,16 +575,20 @@ class SoftwareUpdateResearchAgent:
 
         # Check cache first
         date_range = (start_date, end_date)
-        cached_results = self._load_cache(tool_name, date_range)
+        cache_file = self._cache_path(tool_name, date_range)
+        cached_results = await self._load_cache(tool_name, cache_file)
         if cached_results:
             return cached_results
 
-        # Step 1: Check if tool has API endpoint
-        if self.api_registry.has_api_endpoint(tool_name):
+        # Step 1: Check if tool has API endpoint (one registry lookup, reused
+        # by the API path)
+        endpoint_info = self.api_registry.get_endpoint(tool_name)
+        if endpoint_info is not None and endpoint_info.get('endpoint') is not None:
             print(f"   ✅ Found API endpoint in registry")
-            api_results = await self._research_via_api(tool_name, start_date, end_date)
+            api_results = await self._research_via_api(
+                tool_name, start_date, end_date, endpoint_info)
             if api_results['success']:
-                self._save_cache(tool_name, date_range, api_results)
+                await self._save_cache(cache_file, tool_name, date_range, api_results)
                 return api_results
             else:
                 print(f"   ⚠️ API research failed, falling back to web scraping")
@@ -172,7 +605,7 @@ class SoftwareUpdateResearchAgent:
         )
 
         # Save to cache
-        self._save_cache(tool_name, date_range, web_results)
+        await self._save_cache(cache_file, tool_name, date_range, web_results)
 
         return web_results
 
@@ -180,10 +613,12 @@ class SoftwareUpdateResearchAgent:
         self,
         tool_name: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        endpoint_info: Optional[Dict] = None
     ) -> Dict[str, Any]:
         """Research using API endpoint"""
-        endpoint_info = self.api_registry.get_endpoint(tool_name)
+        if endpoint_info is None:
+            endpoint_info = self.api_registry.get_endpoint(tool_name)
 
         if not endpoint_info or not endpoint_info.get('endpoint'):
             return {'success': False, 'error': 'No API endpoint available'}
@@ -232,76 +667,29 @@ class SoftwareUpdateResearchAgent:
         year_end = end_date.split('-')[0]
 
         research_task = Task(
-            description=f'''Research software updates for {tool_name} from {year_start} to {year_end}.
-
-IMPORTANT: You have web search tools available. Use them to find REAL information from vendor websites.
-
-RESEARCH STRATEGY:
-1. First, understand what this tool is:
-   - Search: "{tool_name} official website"
-   - Search: "{tool_name} company"
-   
-2. Then search for updates and release notes:
-   - Search: "{tool_name} release notes {year_start}"
-   - Search: "{tool_name} what's new {year_end}"
-   - Search: "{tool_name} changelog"
-   - Search: "{tool_name} updates {year_start}-{year_end}"
-   
-3. Look for API and integration improvements:
-   - Search: "{tool_name} API updates"
-   - Search: "{tool_name} new features automation"
-   - Search: "{tool_name} integration enhancements"
-
-WHAT TO FIND:
-Focus on features that enable automation:
-- New API endpoints or capabilities
-- Webhook support
-- Workflow automation features
-- Integration improvements
-- Data export/import enhancements
-- OAuth or authentication improvements
-- Real-time sync capabilities
-
-OUTPUT FORMAT:
-For EACH real update you find, provide:
-
-Feature Name: [Specific feature name from vendor]
-Release Date: [Actual date or quarter, e.g., "Q2 2024" or "March 2024"]
-Source URL: [Where you found this information]
-Description: [What specifically changed - be detailed]
-Automation Value: [How this helps automate work]
-
----
-
-If after thorough searching you find NO public updates:
-State clearly: "No public updates found for {tool_name}"
-Then explain:
-- What searches you performed
-- Possible reasons (login-required portal, no public changelog, etc.)
-
-CRITICAL RULES:
-- Only report information you actually found via web search
-- Include source URLs for everything
-- Be specific with feature names (not generic like "API improvements")
-- If you can't find something, say so honestly
-''',
-            agent=self.research_agent,
+            description=_RESEARCH_PROMPT.substitute(
+                tool_name=tool_name,
+                year_start=year_start,
+                year_end=year_end
+            ),
             expected_output=f'List of verified updates with source URLs, or honest statement that no public updates were found'
         )
 
-        crew = Crew(
-            agents=[self.research_agent],
-            tasks=[research_task],
-            verbose=True
-        )
-
+        crew = self._checkout_crew(research_task)
         try:
             print(f"   🔍 Researching {tool_name} with web search...")
-            research_output = crew.kickoff()
+            # kickoff() blocks for the whole search + LLM round trip; run it
+            # in a worker thread so the other tools' research overlaps it
+            try:
+                research_output = await asyncio.to_thread(crew.kickoff)
+            finally:
+                self._checkin_crew(crew)
 
             # Parse the output
-            structured_updates = self._parse_agent_output(
-                research_output,
+            # Render the crew output to text once; parser and result share it
+            raw_output = str(research_output)
+            structured_updates = await self._parse_agent_output(
+                raw_output,
                 tool_name,
                 tool_type,
                 start_date,
@@ -316,7 +704,7 @@ CRITICAL RULES:
                 'date_range': f"{start_date} to {end_date}",
                 'research_depth': research_depth,
                 'updates': structured_updates,
-                'raw_output': str(research_output),
+                'raw_output': raw_output,
                 'timestamp': datetime.now().isoformat()
             }
 
@@ -329,9 +717,9 @@ CRITICAL RULES:
                 'updates': []
             }
 
-    def _parse_agent_output(
+    async def _parse_agent_output(
         self,
-        agent_output: Any,
+        output_text: str,
         tool_name: str,
         tool_type: str,
         start_date: str,
@@ -341,109 +729,45 @@ CRITICAL RULES:
         Parse agent output into structured updates.
         Returns empty list if no updates found.
         """
-        output_text = str(agent_output)
-
         # Check if agent explicitly said no updates found
-        no_updates_patterns = [
-            'no public updates found',
-            'no updates found',
-            'could not find',
-            'no information available',
-            'no public changelog',
-            'no verifiable updates'
-        ]
-
-        if any(pattern in output_text.lower() for pattern in no_updates_patterns):
+        if _NO_UPDATES_RE.search(output_text):
             print(f"   ℹ️  Agent found no public updates for {tool_name}")
             return []
 
         # Try to extract structured updates
         updates = []
 
-        # Look for the structured format we asked for
-        sections = output_text.split('---')
-
-        for section in sections:
-            if not section.strip():
+        # Look for the structured format we asked for: "Key: value" lines,
+        # one block per update, blocks separated by "---" lines. Read line
+        # by line rather than splitting the whole output into sections.
+        update = Update()
+        for line in io.StringIO(output_text):
+            line = line.strip()
+            if line.startswith('---') and not line.strip('-'):
+                # Only add if we have at least a feature name
+                if update.feature_name:
+                    updates.append(update)
+                update = Update()
                 continue
 
-            update = {}
-            lines = section.split('\n')
-
-            for line in lines:
-                line = line.strip()
-                if not line or ':' not in line:
-                    continue
-
-                key, value = line.split(':', 1)
-                key = key.strip().lower()
-                value = value.strip()
-
-                if 'feature' in key or 'name' in key:
-                    update['feature_name'] = value
-                elif 'date' in key or 'released' in key:
-                    update['release_date'] = value
-                elif 'url' in key or 'source' in key:
-                    update['source_url'] = value
-                elif 'description' in key:
-                    update['description'] = value
-                elif 'automation' in key or 'value' in key:
-                    update['automation_value'] = value
-
-            # Only add if we have at least a feature name
-            if update.get('feature_name'):
-                updates.append(update)
-
-        # If no structured parsing worked, try the old method
-        if not updates:
-            # Use AI to structure the findings
-            try:
-                analysis_task = Task(
-                    description=f'''Analyze the research findings and create structured update records.
-                    
-                    Research Output:
-                    {output_text}
-                    
-                    For each update/feature found:
-                    1. Extract the feature name
-                    2. Identify release date (or estimate quarter if not found)
-                    3. Summarize what it does
-                    4. Generate a business impact description focusing on:
-                       - Time savings potential
-                       - Manual work that can be eliminated
-                       - Process improvements
-                       - Integration opportunities
-                    5. Estimate implementation difficulty (quick/medium/complex)
-                    
-                    Format as a JSON list where each item has:
-                    - feature_name: string
-                    - release_date: string (YYYY-MM-DD or YYYY-QQ)
-                    - description: string (2-3 sentences)
-                    - automation_value: string (specific time/cost savings)
-                    - business_impact: string (how this helps the business)
-                    - implementation_difficulty: string (quick/medium/complex)
-                    ''',
-                    agent=self.research_agent,
-                    expected_output='JSON formatted list of structured update records'
-                )
+            key, sep, value = line.partition(':')
+            if not sep:
+                continue
 
-                crew = Crew(
-                    agents=[self.research_agent],
-                    tasks=[analysis_task],
-                    verbose=False
-                )
+            field = next(
+                (_KEY_MAP[word] for word in _KEY_WORD_RE.findall(key.lower()) if word in _KEY_MAP),
+                None
+            )
+            if field:
+                setattr(update, field, value.strip())
 
-                analysis_output = crew.kickoff()
+        if update.feature_name:
+            updates.append(update)
 
-                # Try to parse as JSON
-                try:
-                    parsed_updates = json.loads(str(analysis_output))
-                    if isinstance(parsed_updates, list) and parsed_updates:
-                        updates = parsed_updates
-                except:
-                    pass
-            except Exception as e:
-                print(f"   ⚠️ Analysis parsing error: {e}")
+        # Fields not laid out one per line: pull them out by label instead
+        if not updates:
+            updates = _extract_labelled_updates(output_text)
+        updates = [u.to_dict() for u in updates]
 
         if not updates:
             print(f"   ⚠️  Could not parse structured updates from agent output")
@@ -475,31 +799,31 @@ CRITICAL RULES:
         print(f"   Date Range: {start_date} to {end_date}")
         print(f"   Research Depth: {research_depth}")
 
-        results = {}
-
-        for tool in tools:
-            tool_name = tool.get('name', tool.get('Tool Name', ''))
-            tool_type = tool.get('type', tool.get('Tool Type', 'unknown'))
+        sem = asyncio.Semaphore(self.max_concurrency)
 
-            try:
-                research_result = await self.research_tool_updates(
-                    tool_name=tool_name,
-                    tool_type=tool_type,
+        async def _one(tool: Dict) -> Dict[str, Any]:
+            async with sem:
+                return await self.research_tool_updates(
+                    tool_name=tool.get('name', tool.get('Tool Name', '')),
+                    tool_type=tool.get('type', tool.get('Tool Type', 'unknown')),
                     start_date=start_date,
                     end_date=end_date,
                     research_depth=research_depth
                 )
-                results[tool_name] = research_result
 
-                # Brief pause to avoid rate limiting
-                await asyncio.sleep(1)
+        # Research up to max_concurrency tools at once; results keep tool order
+        outcomes = await asyncio.gather(*(_one(t) for t in tools), return_exceptions=True)
 
-            except Exception as e:
-                print(f"   ❌ Error researching {tool_name}: {e}")
-                results[tool_name] = {
+        results = {}
+        for tool, outcome in zip(tools, outcomes):
+            tool_name = tool.get('name', tool.get('Tool Name', ''))
+            if isinstance(outcome, Exception):
+                print(f"   ❌ Error researching {tool_name}: {outcome}")
+                outcome = {
                     'success': False,
-                    'error': str(e)
+                    'error': str(outcome)
                 }
+            results[tool_name] = outcome
 
         return {
             'total_tools': len(tools),
@@ -520,25 +844,24 @@ async def research_tool_updates(
     research_depth: str = "medium"
 ) -> Dict[str, Any]:
     """Quick function to research a single tool"""
-    agent = SoftwareUpdateResearchAgent()
-    return await agent.research_tool_updates(
-        tool_name, tool_type, start_date, end_date, research_depth
-    )
+    async with SoftwareUpdateResearchAgent() as agent:
+        return await agent.research_tool_updates(
+            tool_name, tool_type, start_date, end_date, research_depth
+        )
 
 
 # Example usage
 if __name__ == "__main__":
     async def test_research():
-        agent = SoftwareUpdateResearchAgent()
-
-        # Test with a single tool
-        result = await agent.research_tool_updates(
-            tool_name="Microsoft 365",
-            tool_type="productivity_suite",
-            start_date="2023-10-01",
-            end_date="2025-10-01",
-            research_depth="medium"
-        )
+        async with SoftwareUpdateResearchAgent() as agent:
+            # Test with a single tool
+            result = await agent.research_tool_updates(
+                tool_name="Microsoft 365",
+                tool_type="productivity_suite",
+                start_date="2023-10-01",
+                end_date="2025-10-01",
+                research_depth="medium"
+            )
 
         print("\n" + "="*60)
         print("📊 Research Results:")